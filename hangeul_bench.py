@@ -0,0 +1,225 @@
+# --- 변환기 벤치마크 및 왕복(round-trip) 검증 ---
+# 한글 문장을 두벌식 키 입력으로 분해해 말뭉치를 만들고, 각 변환 엔진으로 다시 한글로 바꾸며
+# 처리량(문자/초), 호출당 지연 시간(p50/p99), 최대 메모리를 측정합니다.
+# 변환 결과가 원래 한글과 다르면 실패로 보고하므로, 속도 개선이 결과를 깨뜨리면 바로 드러납니다.
+#
+# 사용 예:
+#   python hangeul_bench.py
+#   python hangeul_bench.py --scale 4 --engines eng_to_hangeul,vectorized --json
+import argparse
+import functools
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from hangeul_core import (
+    CHOSUNG_LIST, JUNGSUNG_LIST, JONGSUNG_LIST, HANGEUL_BASE, TYPED_KEY_TO_JAMO,
+    eng_to_hangeul, combine_all_jamo, hangeul_to_eng,
+)
+from hangeul_cache import TokenCache
+from hangeul_parallel import DEFAULT_MIN_PARALLEL_SIZE, convert_parallel, default_workers
+from hangeul_vectorized import HAS_NUMPY, eng_to_hangeul_vectorized
+
+# 실제 문장 표본 (Shift 자모는 대문자 키로 입력됨: 빵 → Qkd)
+SAMPLE_TEXT = (
+    "동해물과 백두산이 마르고 닳도록 하느님이 보우하사 우리나라 만세 "
+    "무궁화 삼천리 화려 강산 대한 사람 대한으로 길이 보전하세 "
+    "남산 위에 저 소나무 철갑을 두른 듯 바람 서리 불변함은 우리 기상일세 "
+    "가을 하늘 공활한데 높고 구름 없이 밝은 달은 우리 가슴 일편단심일세 "
+    "안녕하세요 감사합니다 죄송합니다 반갑습니다 수고하셨습니다 "
+    "오늘 날씨가 좋아서 공원에 산책을 다녀왔어요 내일은 비가 온다고 하네요 "
+    "검색어를 입력하세요 주문 내역 확인 배송 조회 고객 센터 문의 "
+    "읽어 보세요 밟아 주세요 닭고기 볶음밥 삶은 달걀 넓은 마당 값진 경험 "
+    "빵집 아빠 짜장면 또 까치 있었어요 예쁜 얘기"
+)
+
+
+PARALLEL_CHUNK_SIZE = 32 * 1024   # parallel 엔진의 작업 하나당 문자 수 (long 입력도 여러 조각으로 나뉨)
+
+
+def random_syllable(rng):
+    """임의의 완성형 한글 글자"""
+    cho = rng.randrange(len(CHOSUNG_LIST))
+    jung = rng.randrange(len(JUNGSUNG_LIST))
+    jong = rng.randrange(len(JONGSUNG_LIST)) if rng.random() < 0.4 else 0
+    return chr(HANGEUL_BASE + cho * 588 + jung * 28 + jong)
+
+
+def sample_words():
+    """실제 문장 표본의 단어 목록"""
+    return SAMPLE_TEXT.split()
+
+
+def random_word(rng, words):
+    """표본 단어 또는 임의 글자 1~4개로 된 단어"""
+    if rng.random() < 0.5:
+        return rng.choice(words)
+    return "".join(random_syllable(rng) for _ in range(rng.randint(1, 4)))
+
+
+def build_corpora(scale=1, seed=0):
+    """
+    측정용 말뭉치 생성: {이름: [기대하는 한글 출력, ...]}
+    입력 키 문자열은 hangeul_to_eng 으로 만듭니다.
+    """
+    rng = random.Random(seed)
+    words = sample_words()
+    extras = ['2024년', '10%', '(주)', '漢字', 'かな', '😀', '#1', '...', '!?']
+
+    short = [" ".join(random_word(rng, words) for _ in range(rng.randint(1, 3)))
+             for _ in range(2000 * scale)]
+    long = [" ".join(random_word(rng, words) for _ in range(10000))
+            for _ in range(4 * scale)]
+    nospace = ["".join(random_syllable(rng) for _ in range(20000))
+               for _ in range(4 * scale)]
+    mixed = [" ".join(rng.choice(extras) if rng.random() < 0.3 else random_word(rng, words)
+                      for _ in range(50))
+             for _ in range(200 * scale)]
+    # convert_parallel 의 기본 임계값(DEFAULT_MIN_PARALLEL_SIZE)을 넘는 큰 문서
+    document = []
+    for _ in range(scale):
+        parts, size = [], 0
+        while size < DEFAULT_MIN_PARALLEL_SIZE:
+            parts.append(random_word(rng, words))
+            size += len(hangeul_to_eng(parts[-1])) + 1
+        document.append(" ".join(parts))
+    return {'short': short, 'long': long, 'nospace': nospace, 'mixed': mixed, 'document': document}
+
+
+def _combine_all_jamo_text(text):
+    """combine_all_jamo 경로 측정용: 키 입력을 자모 리스트로 바꾼 뒤 조합"""
+    return "".join(combine_all_jamo([TYPED_KEY_TO_JAMO.get(char, char) for char in text]))
+
+
+def build_engines():
+    """측정할 변환 엔진: {이름: 함수}"""
+    engines = {
+        'eng_to_hangeul': eng_to_hangeul,
+        'combine_all_jamo': _combine_all_jamo_text,
+        'token_cache': TokenCache(),
+        # 기본값이면 document 말고는(코어가 하나면 전부) 단일 프로세스로 처리되므로,
+        # 조각이 둘 이상인 입력은 항상 프로세스 풀에서 변환하도록 고정
+        'parallel': functools.partial(convert_parallel, workers=max(2, default_workers()),
+                                      chunk_size=PARALLEL_CHUNK_SIZE, min_parallel_size=0),
+    }
+    if HAS_NUMPY:
+        engines['vectorized'] = eng_to_hangeul_vectorized
+    return engines
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값에서 백분위 값 (최근접 순위)"""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run_benchmark(engine, inputs, expected):
+    """엔진 하나를 말뭉치 하나에 대해 측정하고 왕복 결과를 확인"""
+    latencies = []
+    failures = 0
+    clock = time.perf_counter
+    for keys, want in zip(inputs, expected):
+        start = clock()
+        got = engine(keys)
+        latencies.append(clock() - start)
+        if got != want:
+            failures += 1
+
+    # 최대 메모리는 추적 비용이 크므로 시간 측정과 따로 한 번 더 실행
+    tracemalloc.start()
+    for keys in inputs:
+        engine(keys)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    latencies.sort()
+    chars = sum(len(keys) for keys in inputs)
+    return {
+        'calls': len(inputs),
+        'chars': chars,
+        'chars_per_sec': chars / total if total else float('inf'),
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'peak_kib': peak / 1024,
+        'failures': failures,
+    }
+
+
+def measure_import_time(module, repeat=10):
+    """
+    새 파이썬 프로세스에서 module 을 임포트하는 데 걸리는 누적 시간(ms)의 중앙값
+    (-X importtime 출력 기준, 임포트에 실패하면 None)
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=here, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return None
+        for line in proc.stderr.splitlines():
+            # "import time:  self [us] | cumulative | imported package"
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module and fields[2].startswith(' ' + module):
+                samples.append(int(fields[1]) / 1000)
+    if not samples:
+        return None
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="영타 → 한글 변환기 벤치마크 및 왕복 검증")
+    parser.add_argument('--scale', type=int, default=1, help="말뭉치 크기 배수 (기본값: 1)")
+    parser.add_argument('--seed', type=int, default=0, help="말뭉치 생성 시드")
+    parser.add_argument('--engines', help="쉼표로 구분한 엔진 이름 (기본값: 전부)")
+    parser.add_argument('--corpora', help="쉼표로 구분한 말뭉치 이름 (기본값: 전부)")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON 으로 출력")
+    parser.add_argument('--import-time', action='store_true',
+                        help="변환 엔진(hangeul_core)과 Streamlit 앱(app)의 임포트 시간만 측정")
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        timings = {module: measure_import_time(module) for module in ('hangeul_core', 'app')}
+        if args.json:
+            json.dump(timings, sys.stdout, indent=2)
+            print()
+        else:
+            for module, ms in timings.items():
+                print(f"import {module:12} " + (f"{ms:8.2f}ms" if ms is not None else "     n/a (임포트 실패)"))
+        return
+
+    engines = build_engines()
+    if args.engines:
+        engines = {name: engines[name] for name in args.engines.split(',')}
+    corpora = build_corpora(args.scale, args.seed)
+    if args.corpora:
+        corpora = {name: corpora[name] for name in args.corpora.split(',')}
+
+    results = []
+    for corpus_name, expected in corpora.items():
+        inputs = [hangeul_to_eng(text) for text in expected]
+        for engine_name, engine in engines.items():
+            result = run_benchmark(engine, inputs, expected)
+            result.update(corpus=corpus_name, engine=engine_name)
+            results.append(result)
+            if not args.json:
+                print(f"{corpus_name:8} {engine_name:16} {result['chars_per_sec']:>14,.0f} chars/s "
+                      f"p50 {result['p50_ms']:9.3f}ms  p99 {result['p99_ms']:9.3f}ms  "
+                      f"peak {result['peak_kib']:10,.1f}KiB  failures {result['failures']}")
+
+    if args.json:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    if any(result['failures'] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# --- 단어 단위 LRU 캐시 변환기 ---
+# 실제 오타 텍스트에서는 같은 단어가 반복해서 나오므로(rkatkgkqslek → 감사합니다 등),
+# 자모가 아닌 문자(공백, 문장부호 등)로 나눈 토큰마다 변환 결과를 기억해 둡니다.
+# 자모가 아닌 문자에서는 조합 상태가 항상 초기화되므로 결과는 캐시 없이 변환한 것과 같습니다.
+#
+# 코드 스트림 엔진(eng_to_hangeul)이 토큰 하나를 조합하는 비용은 파이썬 함수 호출 한 번보다 작으므로,
+# 이 캐시는 적중률이 높을 때(같은 단어가 maxsize 안에서 되풀이될 때)만 더 빠릅니다.
+# 서로 다른 단어가 maxsize 보다 많은 긴 텍스트(bench 의 long)에서는 eng_to_hangeul 보다 느립니다.
+# 그래서 적중은 C 수준의 dict 조회로만 처리하고, 실패한 토큰은 모아서 eng_to_hangeul 한 번으로 변환합니다.
+import re
+import sys
+import threading
+from collections import OrderedDict, deque
+
+from hangeul_core import KEY_TABLE, eng_to_hangeul
+from hangeul_metrics import active_metrics
+
+# 자판 키로만 이루어진 연속 구간 (= 한 번에 조합되는 토큰)
+TOKEN_PATTERN = re.compile('[%s]+' % re.escape(''.join(sorted(KEY_TABLE))))
+# re.split 결과의 홀수 번째가 토큰이 되도록 묶은 패턴
+_TOKEN_SPLIT = re.compile('(%s)' % TOKEN_PATTERN.pattern)
+
+
+class TokenCache:
+    """
+    토큰별 변환 결과를 크기 제한이 있는 LRU 로 기억하는 변환기
+    max_token_length 보다 긴 토큰(URL, 해시 등)은 다시 나올 가능성이 낮으므로 캐시하지 않습니다.
+    """
+
+    def __init__(self, maxsize=4096, max_token_length=32):
+        if maxsize <= 0:
+            raise ValueError("maxsize 는 양수여야 합니다.")
+        self.maxsize = maxsize
+        self.max_token_length = max_token_length
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __call__(self, text):
+        return self.convert(text)
+
+    def convert(self, text):
+        """eng_to_hangeul 과 같은 결과를 토큰 캐시를 거쳐 반환"""
+        pieces = _TOKEN_SPLIT.split(text)
+        tokens = pieces[1::2]
+        entries = self._entries
+        converted = list(map(entries.get, tokens))
+        if None in converted:
+            # 토큰에는 공백이 없고 조합은 줄바꿈을 넘지 않으므로, 실패한 토큰을 이어 붙여 한 번에 변환
+            unique = list(dict.fromkeys(token for token, value in zip(tokens, converted) if value is None))
+            fresh = dict(zip(unique, eng_to_hangeul('\n'.join(unique)).split('\n')))
+            hit_tokens = [token for token, value in zip(tokens, converted) if value is not None]
+            converted = [fresh[token] if value is None else value for token, value in zip(tokens, converted)]
+        else:
+            fresh = {}
+            hit_tokens = tokens
+        deque(map(entries.move_to_end, hit_tokens), 0)
+        self.hits += len(tokens) - len(fresh)
+        self.misses += len(fresh)
+
+        for token, value in fresh.items():
+            if len(token) <= self.max_token_length:
+                entries[token] = value
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+        pieces[1::2] = converted
+        return "".join(pieces)
+
+    def lookup(self, token):
+        """키 토큰 하나를 변환 (캐시에 있으면 재사용)"""
+        entries = self._entries
+        converted = entries.get(token)
+        if converted is not None:
+            self.hits += 1
+            entries.move_to_end(token)
+            return converted
+
+        self.misses += 1
+        converted = eng_to_hangeul(token)
+        if len(token) <= self.max_token_length:
+            entries[token] = converted
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        return converted
+
+    def stats(self):
+        """캐시 적중/실패/제거 횟수와 현재 크기"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """캐시와 통계를 비움"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+class SharedConversionCache:
+    """
+    여러 세션(스레드)이 함께 쓰는 입력 전체 단위 변환 캐시
+    항목 수가 아니라 대략적인 메모리 사용량(max_bytes)으로 크기를 제한하며, 너무 큰 입력은 캐시하지 않습니다.
+    """
+
+    def __init__(self, max_bytes=32 << 20, max_entry_bytes=1 << 20, convert=eng_to_hangeul):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._convert = convert
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def convert(self, text):
+        """캐시에 있으면 저장된 결과를, 없으면 변환 후 저장한 결과를 반환"""
+        with self._lock:
+            converted = self._entries.get(text)
+            if converted is not None:
+                self.hits += 1
+                self._entries.move_to_end(text)
+                return converted
+            self.misses += 1
+
+        # 변환은 잠금 밖에서 수행 (같은 입력이 동시에 들어오면 중복 변환될 수 있으나 결과는 같음)
+        metrics = active_metrics()
+        metrics.observe_size('compose_chars', len(text))
+        with metrics.timer('compose'):
+            converted = self._convert(text)
+        metrics.count_transitions(text)
+        size = sys.getsizeof(text) + sys.getsizeof(converted)
+        if size > self.max_entry_bytes:
+            return converted
+
+        with self._lock:
+            if text not in self._entries:
+                self._entries[text] = converted
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    old_text, old_converted = self._entries.popitem(last=False)
+                    self.bytes -= sys.getsizeof(old_text) + sys.getsizeof(old_converted)
+                    self.evictions += 1
+        return converted
+
+    def stats(self):
+        """운영자용 통계: 적중/실패/제거 횟수, 항목 수, 메모리 사용량"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """캐시와 통계를 비움"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,284 @@
+# --- 열 단위 일괄 변환 (CSV / NDJSON / Parquet / Arrow) ---
+# 데이터 추출 파일에서 한글을 영문 자판으로 입력한 텍스트 열만 골라 변환합니다.
+# 파일을 batch_size 행씩 읽어 변환 후 바로 같은 형식으로 쓰므로 메모리는 배치 크기에 비례합니다.
+# 같은 값이 반복되는 열이 많으므로, 배치마다 서로 다른 값만 한 번씩 변환한 뒤 모든 행에 나눠 씁니다.
+# 배치 사이에는 크기 제한이 있는 캐시로 자주 나오는 값의 변환 결과를 재사용합니다.
+#
+# 사용 예:
+#   python hangeul_columns.py export.csv -o export.ko.csv -c comment -c title
+#   python hangeul_columns.py events.parquet -o events.ko.parquet -c query
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+
+from hangeul_cache import SharedConversionCache
+from hangeul_core import eng_to_hangeul
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet/Arrow 형식에만 필요
+    pa = None
+
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_CACHE_BYTES = 16 << 20
+
+FORMATS = {
+    '.csv': 'csv', '.tsv': 'csv',
+    '.ndjson': 'ndjson', '.jsonl': 'ndjson',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow', '.feather': 'arrow',
+}
+
+
+def detect_format(path):
+    """파일 확장자로 형식 추정"""
+    fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"형식을 알 수 없는 파일입니다: {path} (--format 으로 지정하세요)")
+    return fmt
+
+
+class ColumnConverter:
+    """
+    값 목록을 중복 없이 변환하는 도우미
+    배치 안의 서로 다른 값만 변환하며, 배치 사이에서는 캐시로 결과를 재사용합니다.
+    """
+
+    def __init__(self, cache_bytes=DEFAULT_CACHE_BYTES):
+        self.cache = SharedConversionCache(max_bytes=cache_bytes, convert=eng_to_hangeul)
+        self.rows = 0
+        self.values = 0
+        self.distinct = 0
+
+    def convert_values(self, values):
+        """값 목록을 변환 (None 등 문자열이 아닌 값은 그대로)"""
+        mapping = {}
+        for value in values:
+            if isinstance(value, str) and value not in mapping:
+                mapping[value] = None
+        for value in mapping:
+            mapping[value] = self.cache.convert(value)
+        self.values += len(values)
+        self.distinct += len(mapping)
+        return [mapping[value] if isinstance(value, str) else value for value in values]
+
+    def convert_distinct(self, distinct_values):
+        """이미 중복이 제거된 값 목록을 변환 (Arrow 사전 인코딩용)"""
+        self.distinct += len(distinct_values)
+        return [self.cache.convert(value) if value is not None else None for value in distinct_values]
+
+    def stats(self):
+        """처리한 행/값 수와 실제로 변환한 값 수"""
+        cache = self.cache.stats()
+        return {
+            'rows': self.rows,
+            'values': self.values,
+            'distinct_per_batch': self.distinct,
+            'conversions': cache['misses'],
+            'cache_hits': cache['hits'],
+        }
+
+
+def _resolve_columns(names, columns):
+    """열 이름(또는 0부터 시작하는 번호) 목록을 열 번호 목록으로 변환"""
+    indices = []
+    for column in columns:
+        if column in names:
+            indices.append(names.index(column))
+        elif column.isdigit() and int(column) < len(names):
+            indices.append(int(column))
+        else:
+            raise ValueError(f"열을 찾을 수 없습니다: {column}")
+    return indices
+
+
+def _batched(iterable, size):
+    """iterable 을 size 개씩 묶은 리스트로 내보냄"""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _chain_first(first, rest):
+    """이미 읽은 첫 행을 다시 앞에 붙여 읽음"""
+    yield first
+    yield from rest
+
+
+def convert_csv(src_path, dst_path, columns, converter, batch_size=DEFAULT_BATCH_SIZE, header=True):
+    """CSV/TSV 파일의 지정한 열을 변환 (구분자는 확장자로 결정)"""
+    delimiter = '\t' if src_path.lower().endswith('.tsv') else ','
+    with open(src_path, newline='', encoding='utf-8') as src:
+        reader = csv.reader(src, delimiter=delimiter)
+        first = next(reader, None)
+        # 출력 파일을 열면 내용이 지워지므로, 열 이름을 확인한 뒤에 엶
+        if first is None:
+            indices, rows = [], iter(())
+        elif header:
+            indices = _resolve_columns(first, columns)
+            rows = reader
+        else:
+            indices = _resolve_columns([str(i) for i in range(len(first))], columns)
+            rows = _chain_first(first, reader)
+
+        with open(dst_path, 'w', newline='', encoding='utf-8') as dst:
+            writer = csv.writer(dst, delimiter=delimiter)
+            if first is not None and header:
+                writer.writerow(first)
+            for batch in _batched(rows, batch_size):
+                for index in indices:
+                    values = [row[index] if index < len(row) else None for row in batch]
+                    for row, value in zip(batch, converter.convert_values(values)):
+                        if index < len(row):
+                            row[index] = value
+                writer.writerows(batch)
+                converter.rows += len(batch)
+
+
+def _output_mode(path):
+    """open(path, 'w') 로 썼을 때의 파일 권한 (있으면 기존 파일 권한, 없으면 umask 적용)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def convert_ndjson(src_path, dst_path, columns, converter, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    NDJSON 파일에서 각 객체의 지정한 키 값을 변환
+    CSV 의 없는 열과 같이, 어느 객체에도 없는 키를 지정하면 ValueError 입니다.
+    키가 있는지는 끝까지 읽어야 알 수 있으므로 같은 디렉터리의 임시 파일에 쓴 뒤 성공하면 출력 파일로 바꿉니다.
+    """
+    with open(src_path, encoding='utf-8') as src:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dst_path)), suffix='.tmp')
+        try:
+            os.chmod(tmp_path, _output_mode(dst_path))
+            with open(fd, 'w', encoding='utf-8') as dst:
+                missing = set(columns)
+                lines = (line for line in src if line.strip())
+                for batch in _batched(lines, batch_size):
+                    records = [json.loads(line) for line in batch]
+                    for column in columns:
+                        values = [record.get(column) if isinstance(record, dict) else None for record in records]
+                        for record, value in zip(records, converter.convert_values(values)):
+                            if isinstance(record, dict) and column in record:
+                                record[column] = value
+                                missing.discard(column)
+                    dst.writelines(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+                    converter.rows += len(records)
+            if missing and converter.rows:
+                raise ValueError(f"열을 찾을 수 없습니다: {', '.join(column for column in columns if column in missing)}")
+            os.replace(tmp_path, dst_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _arrow_column_indices(schema, columns):
+    """Arrow 스키마에서 지정한 문자열 열의 번호 목록 (없거나 문자열이 아니면 ValueError)"""
+    indices = []
+    for name in columns:
+        index = schema.get_field_index(name)
+        if index < 0:
+            raise ValueError(f"열을 찾을 수 없습니다: {name}")
+        field_type = schema.field(index).type
+        if not (pa.types.is_string(field_type) or pa.types.is_large_string(field_type)):
+            raise ValueError(f"문자열 열이 아닙니다: {name} ({field_type})")
+        indices.append(index)
+    return indices
+
+
+def _convert_arrow_batch(batch, indices, converter):
+    """Arrow RecordBatch 의 지정한 문자열 열을 사전 인코딩해 서로 다른 값만 변환"""
+    arrays = list(batch.columns)
+    for index in indices:
+        column = arrays[index]
+        encoded = pc.dictionary_encode(column)
+        converted = pa.array(converter.convert_distinct(encoded.dictionary.to_pylist()), type=column.type)
+        arrays[index] = pc.take(converted, encoded.indices)
+        converter.values += len(column)
+    converter.rows += batch.num_rows
+    return pa.RecordBatch.from_arrays(arrays, schema=batch.schema)
+
+
+def convert_parquet(src_path, dst_path, columns, converter, batch_size=DEFAULT_BATCH_SIZE):
+    """Parquet 파일을 행 배치 단위로 읽어 변환 후 같은 스키마로 씀"""
+    source = pq.ParquetFile(src_path)
+    indices = _arrow_column_indices(source.schema_arrow, columns)
+    with pq.ParquetWriter(dst_path, source.schema_arrow) as writer:
+        for batch in source.iter_batches(batch_size=batch_size):
+            writer.write_batch(_convert_arrow_batch(batch, indices, converter))
+
+
+def convert_arrow(src_path, dst_path, columns, converter, batch_size=DEFAULT_BATCH_SIZE):
+    """Arrow IPC(Feather v2) 파일을 레코드 배치 단위로 변환 (mmap 으로 읽음)"""
+    with pa.memory_map(src_path) as source:
+        reader = pa_ipc.open_file(source)
+        indices = _arrow_column_indices(reader.schema, columns)
+        with pa_ipc.new_file(dst_path, reader.schema) as writer:
+            for i in range(reader.num_record_batches):
+                record_batch = reader.get_batch(i)
+                for offset in range(0, record_batch.num_rows, batch_size):
+                    part = record_batch.slice(offset, batch_size)
+                    writer.write_batch(_convert_arrow_batch(part, indices, converter))
+
+
+def convert_columns(src_path, dst_path, columns, fmt=None, batch_size=DEFAULT_BATCH_SIZE,
+                    cache_bytes=DEFAULT_CACHE_BYTES, header=True):
+    """파일의 지정한 열을 변환해 같은 형식으로 쓰고 처리 통계를 반환"""
+    fmt = fmt or detect_format(src_path)
+    converter = ColumnConverter(cache_bytes)
+    if fmt == 'csv':
+        convert_csv(src_path, dst_path, columns, converter, batch_size, header)
+    elif fmt == 'ndjson':
+        convert_ndjson(src_path, dst_path, columns, converter, batch_size)
+    elif fmt in ('parquet', 'arrow'):
+        if pa is None:
+            raise RuntimeError(f"{fmt} 형식에는 pyarrow 가 필요합니다 (pip install pyarrow).")
+        convert = convert_parquet if fmt == 'parquet' else convert_arrow
+        convert(src_path, dst_path, columns, converter, batch_size)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    return converter.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV/NDJSON/Parquet/Arrow 파일의 텍스트 열을 한글로 변환합니다.")
+    parser.add_argument('input', help="입력 파일")
+    parser.add_argument('-o', '--output', required=True, help="출력 파일 (입력과 같은 형식)")
+    parser.add_argument('-c', '--column', action='append', required=True, dest='columns',
+                        help="변환할 열 이름 (여러 번 지정 가능, 헤더 없는 CSV 는 0부터 시작하는 번호)")
+    parser.add_argument('--format', choices=sorted(set(FORMATS.values())),
+                        help="입력 형식 (기본값: 확장자로 추정)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help="한 번에 처리할 행 수 (기본값: %(default)s)")
+    parser.add_argument('--cache-bytes', type=int, default=DEFAULT_CACHE_BYTES,
+                        help="배치 사이 변환 결과 캐시 크기 (기본값: %(default)s)")
+    parser.add_argument('--no-header', action='store_true', help="CSV 첫 줄이 헤더가 아님")
+    args = parser.parse_args(argv)
+    if args.batch_size <= 0:
+        raise SystemExit("--batch-size 는 양수여야 합니다.")
+
+    try:
+        stats = convert_columns(args.input, args.output, args.columns, args.format,
+                                args.batch_size, args.cache_bytes, not args.no_header)
+    except (ValueError, RuntimeError) as error:
+        raise SystemExit(str(error))
+    print(json.dumps(stats), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
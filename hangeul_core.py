@@ -0,0 +1,452 @@
+# --- 영타 → 한글 변환 엔진 (UI 와 분리된 핵심 모듈) ---
+# 표준 라이브러리 외의 의존성이 없으므로 배치 작업, 작업 프로세스, 테스트에서 빠르게 임포트할 수 있습니다.
+# Streamlit 화면(app.py)은 이 모듈을 감싸는 얇은 프런트엔드입니다.
+
+# --- 1. 한글 자모 및 변환 맵 정의 ---
+# 이 코드는 외부 라이브러리 없이 영문 키 입력을 한글 자모로 매핑하고, 
+# 이 자모들을 조합하여 완성된 한글 글자로 만들어내는 로직을 포함합니다.
+# 한글 두벌식 자판 배열을 기반으로 합니다.
+import re
+import sys
+from array import array
+
+CHOSUNG_LIST = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+JUNGSUNG_LIST = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
+JONGSUNG_LIST = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# Dubeolshik (두벌식) English to Jamo mapping
+ENG_TO_JAMO = {
+    'q': 'ㅂ', 'w': 'ㅈ', 'e': 'ㄷ', 'r': 'ㄱ', 't': 'ㅅ', 'y': 'ㅛ', 'u': 'ㅕ', 'i': 'ㅑ', 'o': 'ㅐ', 'p': 'ㅔ',
+    'a': 'ㅁ', 's': 'ㄴ', 'd': 'ㅇ', 'f': 'ㄹ', 'g': 'ㅎ', 'h': 'ㅗ', 'j': 'ㅓ', 'k': 'ㅏ', 'l': 'ㅣ',
+    'z': 'ㅋ', 'x': 'ㅌ', 'c': 'ㅊ', 'v': 'ㅍ', 'b': 'ㅠ', 'n': 'ㅜ', 'm': 'ㅡ',
+    'Q': 'ㅃ', 'W': 'ㅉ', 'E': 'ㄸ', 'R': 'ㄲ', 'T': 'ㅆ',
+    'O': 'ㅒ', 'P': 'ㅖ', 
+}
+
+# 복합 자모/모음 조합 규칙 (예: ㄳ, ㅘ 등)
+# 딕셔너리 키는 자모 인덱스 (JONG_INDEX, JUNG_INDEX)
+DOUBLE_CONSONANTS = {
+    'ㄱㅅ': 'ㄳ', 'ㄴㅈ': 'ㄵ', 'ㄴㅎ': 'ㄶ', 'ㄹㄱ': 'ㄺ', 'ㄹㅁ': 'ㄻ', 
+    'ㄹㅂ': 'ㄼ', 'ㄹㅅ': 'ㄽ', 'ㄹㅌ': 'ㄾ', 'ㄹㅍ': 'ㄿ', 'ㄹㅎ': 'ㅀ', 
+    'ㅂㅅ': 'ㅄ'
+}
+DOUBLE_VOWELS = {
+    'ㅗㅏ': 'ㅘ', 'ㅗㅐ': 'ㅙ', 'ㅗㅣ': 'ㅚ', 'ㅜㅓ': 'ㅝ', 'ㅜㅔ': 'ㅞ', 
+    'ㅜㅣ': 'ㅟ', 'ㅡㅣ': 'ㅢ'
+}
+
+HANGEUL_BASE = 0xAC00
+
+# --- 1-1. 조합 엔진용 사전 계산 테이블 ---
+# 모든 테이블은 모듈 임포트 시 한 번만 만들어지며, 변환 루프에서는 리스트/딕셔너리 조회만 합니다.
+CHO_INDEX = {jamo: i for i, jamo in enumerate(CHOSUNG_LIST)}
+JUNG_INDEX = {jamo: i for i, jamo in enumerate(JUNGSUNG_LIST)}
+JONG_INDEX = {jamo: i for i, jamo in enumerate(JONGSUNG_LIST)}
+
+_INDEX_TABLES = {
+    id(CHOSUNG_LIST): CHO_INDEX,
+    id(JUNGSUNG_LIST): JUNG_INDEX,
+    id(JONGSUNG_LIST): JONG_INDEX,
+}
+
+
+def fold_shift_keys(key_to_jamo):
+    """
+    Shift 자모가 없는 대문자 키를 소문자 키와 같은 자모로 채운 매핑
+    Q/W/E/R/T/O/P 는 Shift 자모(ㅃ, ㅉ, ㄸ, ㄲ, ㅆ, ㅒ, ㅖ)가 되고, 나머지 대문자(Caps Lock 등)는 소문자 키로 처리됩니다.
+    """
+    folded = dict(key_to_jamo)
+    for key, jamo in key_to_jamo.items():
+        folded.setdefault(key.upper(), jamo)
+    return folded
+
+
+def build_key_table(key_to_jamo):
+    """키 → 자모 매핑으로 조합용 키 테이블 {키: (초성 인덱스, 중성 인덱스)} 생성"""
+    return {
+        key: (CHO_INDEX.get(jamo, -1), JUNG_INDEX.get(jamo, -1))
+        for key, jamo in key_to_jamo.items()
+    }
+
+
+# 실제로 입력된 (대소문자 구분) 키 → 자모
+TYPED_KEY_TO_JAMO = fold_shift_keys(ENG_TO_JAMO)
+
+# 영문 키 → (초성 인덱스, 중성 인덱스). 자음 키는 중성이 -1, 모음 키는 초성이 -1 입니다.
+KEY_TABLE = build_key_table(TYPED_KEY_TO_JAMO)
+
+# 자모 → (초성 인덱스, 중성 인덱스). 자모 리스트를 조합할 때(combine_all_jamo) KEY_TABLE 대신 사용합니다.
+JAMO_TABLE = {
+    jamo: (CHO_INDEX.get(jamo, -1), JUNG_INDEX.get(jamo, -1))
+    for jamo in CHOSUNG_LIST + JUNGSUNG_LIST
+}
+
+# 초성 인덱스 → 종성 인덱스 (ㄸ, ㅃ, ㅉ 처럼 받침이 될 수 없으면 0)
+CHO_TO_JONG = [JONG_INDEX.get(jamo, 0) for jamo in CHOSUNG_LIST]
+
+# 중성 + 모음 → 복합 중성 (ㅗ + ㅏ = ㅘ). 인덱스는 jung * 21 + 모음, 조합 불가는 -1
+JUNG_COMBINE = [-1] * (len(JUNGSUNG_LIST) * len(JUNGSUNG_LIST))
+for _pair, _jamo in DOUBLE_VOWELS.items():
+    JUNG_COMBINE[JUNG_INDEX[_pair[0]] * len(JUNGSUNG_LIST) + JUNG_INDEX[_pair[1]]] = JUNG_INDEX[_jamo]
+
+# 종성 + 자음(초성 인덱스) → 복합 종성 (ㄹ + ㄱ = ㄺ). 인덱스는 jong * 19 + 초성, 조합 불가는 0
+JONG_COMBINE = [0] * (len(JONGSUNG_LIST) * len(CHOSUNG_LIST))
+for _pair, _jamo in DOUBLE_CONSONANTS.items():
+    JONG_COMBINE[JONG_INDEX[_pair[0]] * len(CHOSUNG_LIST) + CHO_INDEX[_pair[1]]] = JONG_INDEX[_jamo]
+
+# 종성 → (남는 종성, 다음 글자로 넘어가는 초성). 받침 뒤에 모음이 오면 마지막 자음이 다음 글자의 초성이 됩니다.
+# 예: ㄺ → (ㄹ, ㄱ), ㄴ → (없음, ㄴ)
+JONG_SPLIT = [(0, -1)] * len(JONGSUNG_LIST)
+for _jamo, _jong in JONG_INDEX.items():
+    if _jamo in CHO_INDEX:
+        JONG_SPLIT[_jong] = (0, CHO_INDEX[_jamo])
+for _pair, _jamo in DOUBLE_CONSONANTS.items():
+    JONG_SPLIT[JONG_INDEX[_jamo]] = (JONG_INDEX[_pair[0]], CHO_INDEX[_pair[1]])
+del _pair, _jamo, _jong
+
+
+def get_jamo_index(jamo, jamo_list):
+    """자모 목록에서 자모의 인덱스를 반환"""
+    table = _INDEX_TABLES.get(id(jamo_list))
+    if table is not None:
+        return table.get(jamo, -1)
+    try:
+        return jamo_list.index(jamo)
+    except ValueError:
+        return -1
+
+def combine_jamo(cho, jung, jong):
+    """초성, 중성, 종성 인덱스를 이용해 완성된 한글 글자를 반환 (종성 0은 받침 없음)"""
+    return chr(HANGEUL_BASE + (cho * 588) + (jung * 28) + jong)
+
+# 조합 중인 글자 상태 (초성, 중성, 종성): 초성/중성은 없으면 -1, 종성은 없으면 0
+EMPTY_STATE = (-1, -1, 0)
+
+def render_state(state):
+    """조합 중인 글자 상태를 문자열로 변환 (완성되지 않은 자모는 단독으로 출력)"""
+    cho, jung, jong = state
+    if jung == -1:
+        return CHOSUNG_LIST[cho] if cho != -1 else ''
+    if cho == -1:
+        return JUNGSUNG_LIST[jung]
+    return chr(HANGEUL_BASE + cho * 588 + jung * 28 + jong)
+
+def _compose_table_into(keys, state, result, key_table):
+    """
+    키 문자열을 한 번만 훑으며 확정된 글자 조각을 result 에 추가
+    (두벌식 조합 상태 머신: 초성 → 중성 → 종성, 복합 모음/복합 종성 포함)
+    마지막에 조합 중인 글자는 확정하지 않고 상태로 반환하므로, 이어지는 입력에 그대로 넘길 수 있습니다.
+    입력 한 글자마다 테이블 조회만 하고 되돌아가지 않으므로 항상 O(n) 입니다.
+    """
+    cho_to_jong = CHO_TO_JONG
+    jung_combine = JUNG_COMBINE
+    jong_combine = JONG_COMBINE
+    jong_split = JONG_SPLIT
+    n_jung = len(JUNGSUNG_LIST)
+    n_cho = len(CHOSUNG_LIST)
+
+    append = result.append
+    cho, jung, jong = state
+
+    for char in keys:
+        entry = key_table.get(char)
+
+        if entry is None:
+            # 자모가 아닌 문자(공백, 숫자, 기호 등)는 조합 중인 글자를 완성한 뒤 그대로 출력
+            if jung == -1:
+                if cho != -1:
+                    append(CHOSUNG_LIST[cho])
+            elif cho == -1:
+                append(JUNGSUNG_LIST[jung])
+            else:
+                append(chr(HANGEUL_BASE + cho * 588 + jung * 28 + jong))
+            append(char)
+            cho, jung, jong = -1, -1, 0
+            continue
+
+        key_cho, key_jung = entry
+
+        if key_jung == -1:
+            # --- 자음 입력 ---
+            if jung == -1:
+                # 초성만 있던 경우 단독 자모로 내보내고 새 초성 시작
+                if cho != -1:
+                    append(CHOSUNG_LIST[cho])
+                cho = key_cho
+            elif cho == -1:
+                # 모음만 있던 경우 단독 모음으로 내보내고 새 초성 시작
+                append(JUNGSUNG_LIST[jung])
+                cho, jung = key_cho, -1
+            elif jong == 0:
+                # 초성 + 중성: 받침이 될 수 있으면 종성으로, 아니면 글자 완성 후 새 초성
+                jong = cho_to_jong[key_cho]
+                if jong == 0:
+                    append(chr(HANGEUL_BASE + cho * 588 + jung * 28))
+                    cho, jung = key_cho, -1
+            else:
+                # 초성 + 중성 + 종성: 복합 종성 시도 (ㄹ + ㄱ = ㄺ)
+                combined = jong_combine[jong * n_cho + key_cho]
+                if combined:
+                    jong = combined
+                else:
+                    append(chr(HANGEUL_BASE + cho * 588 + jung * 28 + jong))
+                    cho, jung, jong = key_cho, -1, 0
+        else:
+            # --- 모음 입력 ---
+            if jung == -1:
+                # 빈 상태이거나 초성만 있는 경우 중성으로 결합
+                jung = key_jung
+            elif jong == 0:
+                # 중성 뒤의 모음: 복합 모음 시도 (ㅗ + ㅏ = ㅘ)
+                combined = jung_combine[jung * n_jung + key_jung]
+                if combined != -1:
+                    jung = combined
+                else:
+                    if cho == -1:
+                        append(JUNGSUNG_LIST[jung])
+                    else:
+                        append(chr(HANGEUL_BASE + cho * 588 + jung * 28))
+                    cho, jung = -1, key_jung
+            else:
+                # 받침 뒤의 모음: 마지막 자음을 떼어 다음 글자의 초성으로 넘김 (닭 + ㅏ = 달가)
+                rest, next_cho = jong_split[jong]
+                append(chr(HANGEUL_BASE + cho * 588 + jung * 28 + rest))
+                cho, jung, jong = next_cho, key_jung, 0
+
+    return cho, jung, jong
+
+# --- 1-1-1. 압축 코드 스트림 조합 ---
+# ASCII 키만 있는 자판(두벌식 등)은 입력을 bytes.translate 한 번으로 한 바이트 코드 스트림으로 바꾼 뒤
+# 정수 코드만 보고 조합하고, 결과 코드포인트는 array('I') 에 4바이트씩 모아 마지막에 한 번에 문자열로 만듭니다.
+# 글자마다 문자열 조각을 만들어 리스트에 쌓지 않으므로 큰 입력의 최대 메모리가 몇 배 줄고 루프도 빨라집니다.
+# 코드: 0~18 자음(초성 인덱스), 64~84 모음(64 + 중성 인덱스), 128~255 자모가 아닌 ASCII 문자(128 + 문자 코드)
+CODE_VOWEL = 64
+CODE_OTHER = 128
+
+CHO_CODEPOINTS = [ord(jamo) for jamo in CHOSUNG_LIST]
+JUNG_CODEPOINTS = [ord(jamo) for jamo in JUNGSUNG_LIST]
+
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+# 짝 없는 서로게이트(\ud800 등)도 그대로 통과시켜야 str 과 같은 결과가 됨
+_SURROGATEPASS = 'surrogatepass'
+_NON_ASCII = re.compile(r'[^\x00-\x7f]+')
+
+
+def build_key_codes(key_table):
+    """키 테이블을 bytes.translate 용 256바이트 코드 테이블로 변환 (ASCII 가 아닌 키가 있으면 None)"""
+    if not all(key.isascii() for key in key_table):
+        return None
+    codes = bytearray(CODE_OTHER + byte for byte in range(128)) + bytearray(128)
+    for key, (cho, jung) in key_table.items():
+        codes[ord(key)] = cho if jung == -1 else CODE_VOWEL + jung
+    return bytes(codes)
+
+
+KEY_CODES = build_key_codes(KEY_TABLE)
+
+# 키 테이블 → 코드 테이블 (같은 객체인지 확인하므로 다른 테이블이 같은 id 를 받아도 섞이지 않음)
+_key_codes_cache = {id(KEY_TABLE): (KEY_TABLE, KEY_CODES)}
+
+
+def get_key_codes(key_table):
+    """키 테이블의 코드 테이블 (처음 쓸 때 한 번 만들고 재사용, ASCII 가 아닌 키가 있으면 None)"""
+    cached = _key_codes_cache.get(id(key_table))
+    if cached is None or cached[0] is not key_table:
+        cached = _key_codes_cache[id(key_table)] = (key_table, build_key_codes(key_table))
+    return cached[1]
+
+
+def compose_codes(codes, state, out):
+    """
+    코드 스트림(bytes)을 조합해 확정된 글자의 코드포인트를 out(array('I'))에 추가하고 마지막 상태를 반환
+    _compose_table_into 와 같은 상태 머신이며, 키 대신 translate 로 만든 정수 코드로 분기합니다.
+    """
+    cho_to_jong = CHO_TO_JONG
+    jung_combine = JUNG_COMBINE
+    jong_combine = JONG_COMBINE
+    jong_split = JONG_SPLIT
+    cho_codepoints = CHO_CODEPOINTS
+    jung_codepoints = JUNG_CODEPOINTS
+    n_jung = len(JUNGSUNG_LIST)
+    n_cho = len(CHOSUNG_LIST)
+
+    append = out.append
+    cho, jung, jong = state
+
+    for code in codes:
+        if code >= CODE_OTHER:
+            # 자모가 아닌 문자: 조합 중인 글자를 완성한 뒤 그대로 출력
+            if jung == -1:
+                if cho != -1:
+                    append(cho_codepoints[cho])
+            elif cho == -1:
+                append(jung_codepoints[jung])
+            else:
+                append(HANGEUL_BASE + cho * 588 + jung * 28 + jong)
+            append(code - CODE_OTHER)
+            cho, jung, jong = -1, -1, 0
+        elif code < CODE_VOWEL:
+            # --- 자음 입력 ---
+            if jung == -1:
+                if cho != -1:
+                    append(cho_codepoints[cho])
+                cho = code
+            elif cho == -1:
+                append(jung_codepoints[jung])
+                cho, jung = code, -1
+            elif jong == 0:
+                jong = cho_to_jong[code]
+                if jong == 0:
+                    append(HANGEUL_BASE + cho * 588 + jung * 28)
+                    cho, jung = code, -1
+            else:
+                combined = jong_combine[jong * n_cho + code]
+                if combined:
+                    jong = combined
+                else:
+                    append(HANGEUL_BASE + cho * 588 + jung * 28 + jong)
+                    cho, jung, jong = code, -1, 0
+        else:
+            # --- 모음 입력 ---
+            vowel = code - CODE_VOWEL
+            if jung == -1:
+                jung = vowel
+            elif jong == 0:
+                combined = jung_combine[jung * n_jung + vowel]
+                if combined != -1:
+                    jung = combined
+                else:
+                    if cho == -1:
+                        append(jung_codepoints[jung])
+                    else:
+                        append(HANGEUL_BASE + cho * 588 + jung * 28)
+                    cho, jung = -1, vowel
+            else:
+                rest, next_cho = jong_split[jong]
+                append(HANGEUL_BASE + cho * 588 + jung * 28 + rest)
+                cho, jung, jong = next_cho, vowel, 0
+
+    return cho, jung, jong
+
+
+def _append_state(state, out):
+    """조합 중인 글자를 코드포인트로 out 에 추가 (render_state 와 같은 규칙)"""
+    cho, jung, jong = state
+    if jung == -1:
+        if cho != -1:
+            out.append(CHO_CODEPOINTS[cho])
+    elif cho == -1:
+        out.append(JUNG_CODEPOINTS[jung])
+    else:
+        out.append(HANGEUL_BASE + cho * 588 + jung * 28 + jong)
+
+
+def _compose_text_codes(keys, state, out, key_codes):
+    """
+    문자열을 코드 스트림으로 바꿔 조합 (ASCII 가 아닌 문자는 키가 될 수 없으므로 그 앞에서 글자를 완성하고 그대로 출력)
+    """
+    if keys.isascii():
+        return compose_codes(keys.encode('ascii').translate(key_codes), state, out)
+    pos = 0
+    for match in _NON_ASCII.finditer(keys):
+        start, end = match.span()
+        if start > pos:
+            state = compose_codes(keys[pos:start].encode('ascii').translate(key_codes), state, out)
+        _append_state(state, out)
+        state = EMPTY_STATE
+        out.frombytes(match.group().encode(_UTF32, _SURROGATEPASS))
+        pos = end
+    if pos < len(keys):
+        state = compose_codes(keys[pos:].encode('ascii').translate(key_codes), state, out)
+    return state
+
+
+def compose_into(keys, state, result, key_table=KEY_TABLE):
+    """
+    영문 키 문자열을 조합해 확정된 부분을 result 에 추가하고, 마지막에 조합 중인 글자는 상태로 반환
+    반환한 상태를 다음 호출에 넘기면 조각으로 나뉜 입력도 한 번에 변환한 것과 같습니다.
+    ASCII 키만 있는 테이블은 압축 코드 스트림으로, 그 외(자모 테이블, 자모 리스트 입력 등)는 키 테이블 조회로 조합합니다.
+    """
+    key_codes = get_key_codes(key_table)
+    if key_codes is None or not isinstance(keys, str):
+        return _compose_table_into(keys, state, result, key_table)
+    out = array('I')
+    state = _compose_text_codes(keys, state, out, key_codes)
+    if out:
+        result.append(out.tobytes().decode(_UTF32, _SURROGATEPASS))
+    return state
+
+def compose(keys, key_table=KEY_TABLE):
+    """영문 키 문자열을 한글 글자 조각 리스트로 조합하고 마지막 글자까지 완성"""
+    result = []
+    state = compose_into(keys, EMPTY_STATE, result, key_table)
+    if state != EMPTY_STATE:
+        result.append(render_state(state))
+    return result
+
+def eng_to_hangeul(text):
+    """
+    영문 문자열을 입력받아 한글로 변환하는 메인 로직
+    (Hangeul composition state machine, 입력 길이에 대해 O(n) 단일 패스)
+    대소문자를 구분하므로 Shift 키(Q → ㅃ, O → ㅒ 등)도 그대로 반영됩니다.
+    """
+    out = array('I')
+    _append_state(_compose_text_codes(text, EMPTY_STATE, out, KEY_CODES), out)
+    return out.tobytes().decode(_UTF32, _SURROGATEPASS)
+
+
+def combine_all_jamo(jamo_list):
+    """
+    자모 리스트를 받아 가능한 한글 글자로 조합
+    eng_to_hangeul 과 같은 상태 머신을 자모 단위로 돌리며, 리스트를 복사하거나 앞에서 꺼내지 않고
+    차례로 한 번만 읽으므로 길이에 비례하는 시간 안에 끝납니다.
+    """
+    return compose(jamo_list, JAMO_TABLE)
+
+
+# --- 1-2. 역변환 (한글 → 두벌식 키 입력) ---
+
+# 자모 → 키 입력. 복합 자모는 두 키로 나누고(ㅘ → hk, ㄺ → fr), Shift 자모는 대문자 키(ㅃ → Q)를 씁니다.
+JAMO_TO_KEYS = {}
+for _key, _jamo in ENG_TO_JAMO.items():
+    JAMO_TO_KEYS.setdefault(_jamo, _key)
+for _pair, _jamo in list(DOUBLE_VOWELS.items()) + list(DOUBLE_CONSONANTS.items()):
+    JAMO_TO_KEYS[_jamo] = JAMO_TO_KEYS[_pair[0]] + JAMO_TO_KEYS[_pair[1]]
+del _key, _jamo, _pair
+
+# 인덱스 → 키 입력 (종성 0 은 받침 없음)
+CHO_KEYS = [JAMO_TO_KEYS[jamo] for jamo in CHOSUNG_LIST]
+JUNG_KEYS = [JAMO_TO_KEYS[jamo] for jamo in JUNGSUNG_LIST]
+JONG_KEYS = [JAMO_TO_KEYS.get(jamo, '') for jamo in JONGSUNG_LIST]
+
+HANGEUL_SYLLABLE_COUNT = 11172  # 0xAC00 ~ 0xD7A3
+
+_reverse_table = None
+
+
+def decompose_syllable(char):
+    """완성형 한글 글자를 (초성, 중성, 종성) 인덱스로 분해 (assemble 의 역연산, 한글이 아니면 None)"""
+    code = ord(char) - HANGEUL_BASE
+    if not 0 <= code < HANGEUL_SYLLABLE_COUNT:
+        return None
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def get_reverse_table():
+    """
+    str.translate 용 역변환 테이블 {코드포인트: 키 입력}
+    모든 완성형 글자를 산술 분해해 한 번만 만들며, 임포트 시간을 늘리지 않도록 처음 쓸 때 생성합니다.
+    """
+    global _reverse_table
+    if _reverse_table is None:
+        table = {ord(jamo): keys for jamo, keys in JAMO_TO_KEYS.items()}
+        for code in range(HANGEUL_SYLLABLE_COUNT):
+            table[HANGEUL_BASE + code] = (
+                CHO_KEYS[code // 588] + JUNG_KEYS[(code % 588) // 28] + JONG_KEYS[code % 28])
+        _reverse_table = table
+    return _reverse_table
+
+
+def hangeul_to_eng(text):
+    """한글 문자열을 그 글자를 만드는 두벌식 키 입력으로 변환 (한글이 아닌 문자는 그대로, O(n))"""
+    return text.translate(get_reverse_table())
@@ -0,0 +1,115 @@
+# --- 키 입력 단위 증분 변환기 (IME 방식) ---
+# eng_to_hangeul 과 같은 조합 테이블을 사용하되, 키를 하나씩 받아 처리합니다.
+# 각 키 입력은 지금 조합 중인 한 글자만 다루므로 버퍼 길이와 상관없이 O(1) 입니다.
+from hangeul_core import (
+    CHOSUNG_LIST, JUNGSUNG_LIST, EMPTY_STATE, render_state,
+    KEY_TABLE, CHO_TO_JONG, JUNG_COMBINE, JONG_COMBINE, JONG_SPLIT,
+)
+
+_N_CHO = len(CHOSUNG_LIST)
+_N_JUNG = len(JUNGSUNG_LIST)
+
+
+class HangeulIME:
+    """
+    두벌식 키 입력을 한 글자씩 조합하는 상태 기반 변환기
+
+    feed()는 이번 입력으로 확정된 문자열을 반환하고, 조합 중인 글자는 composing 으로 확인합니다.
+    모든 키를 feed 한 뒤 flush() 하면 eng_to_hangeul 과 같은 결과가 됩니다.
+    """
+
+    def __init__(self):
+        self._cho, self._jung, self._jong = EMPTY_STATE
+        # 현재 글자를 이루는 각 키 입력 직전의 상태 (백스페이스용, 최대 5개)
+        self._history = []
+
+    @property
+    def composing(self):
+        """조합 중인 글자 (없으면 빈 문자열)"""
+        return render_state((self._cho, self._jung, self._jong))
+
+    def feed(self, key):
+        """키 하나를 입력하고 이번 입력으로 확정된 문자열을 반환"""
+        cho, jung, jong = self._cho, self._jung, self._jong
+        entry = KEY_TABLE.get(key)
+
+        if entry is None:
+            # 자모가 아닌 문자는 조합 중인 글자를 확정하고 그대로 내보냄
+            committed = render_state((cho, jung, jong)) + key
+            self._set(EMPTY_STATE, [])
+            return committed
+
+        key_cho, key_jung = entry
+
+        if key_jung == -1:
+            # --- 자음 입력 ---
+            if jung == -1:
+                if cho == -1:
+                    self._push((key_cho, -1, 0))
+                    return ''
+                committed = CHOSUNG_LIST[cho]
+            elif cho == -1:
+                committed = JUNGSUNG_LIST[jung]
+            elif jong == 0:
+                new_jong = CHO_TO_JONG[key_cho]
+                if new_jong:
+                    self._push((cho, jung, new_jong))
+                    return ''
+                committed = render_state((cho, jung, 0))
+            else:
+                combined = JONG_COMBINE[jong * _N_CHO + key_cho]
+                if combined:
+                    self._push((cho, jung, combined))
+                    return ''
+                committed = render_state((cho, jung, jong))
+            self._set((key_cho, -1, 0), [EMPTY_STATE])
+            return committed
+
+        # --- 모음 입력 ---
+        if jung == -1:
+            self._push((cho, key_jung, 0))
+            return ''
+        if jong == 0:
+            combined = JUNG_COMBINE[jung * _N_JUNG + key_jung]
+            if combined != -1:
+                self._push((cho, combined, 0))
+                return ''
+            committed = render_state((cho, jung, 0))
+            self._set((-1, key_jung, 0), [EMPTY_STATE])
+            return committed
+
+        # 받침 뒤의 모음: 마지막 자음이 다음 글자의 초성이 됨
+        rest, next_cho = JONG_SPLIT[jong]
+        committed = render_state((cho, jung, rest))
+        self._set((next_cho, key_jung, 0), [EMPTY_STATE, (next_cho, -1, 0)])
+        return committed
+
+    def backspace(self):
+        """
+        조합 중인 글자에서 마지막 자모 하나를 지움 (ㅘ → ㅗ, ㄺ → ㄹ)
+        조합 중인 글자가 없으면 False 를 반환하며, 이때는 호출한 쪽에서 확정된 글자를 지웁니다.
+        """
+        if not self._history:
+            return False
+        self._cho, self._jung, self._jong = self._history.pop()
+        return True
+
+    def flush(self):
+        """조합 중인 글자를 확정하여 반환하고 상태를 초기화"""
+        committed = self.composing
+        self._set(EMPTY_STATE, [])
+        return committed
+
+    def reset(self):
+        """확정하지 않고 조합 상태를 버림"""
+        self._set(EMPTY_STATE, [])
+
+    def _push(self, state):
+        """현재 상태를 기록하고 새 상태로 전이"""
+        self._history.append((self._cho, self._jung, self._jong))
+        self._cho, self._jung, self._jong = state
+
+    def _set(self, state, history):
+        """새 글자를 시작하며 상태와 기록을 교체"""
+        self._cho, self._jung, self._jong = state
+        self._history = history
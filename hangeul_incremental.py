@@ -0,0 +1,112 @@
+# --- 편집 인식 증분 변환 ---
+# 긴 문서에서 몇 글자만 고쳐도 전체를 다시 변환하지 않도록, 입력을 공백 뒤에서 끝나는 블록으로 나눠
+# 블록별 변환 결과를 보관합니다. 새 입력이 오면 이전 입력과 공통 앞/뒷부분을 비교해 바뀐 구간을 찾고,
+# 그 구간을 덮는 블록만 다시 조합해 끼워 넣습니다. 조합은 공백을 넘지 않으므로 결과는 전체 변환과 같습니다.
+from bisect import bisect_right
+
+from hangeul_core import eng_to_hangeul
+from hangeul_metrics import active_metrics
+from hangeul_parallel import split_at_whitespace
+
+DEFAULT_BLOCK_SIZE = 4096
+_COMPARE_STEP = 4096
+
+
+def common_prefix_length(a, b):
+    """두 문자열의 공통 앞부분 길이 (큰 조각 단위로 비교한 뒤 어긋난 조각 안에서만 한 글자씩 비교)"""
+    limit = min(len(a), len(b))
+    pos = 0
+    while pos < limit:
+        end = min(pos + _COMPARE_STEP, limit)
+        if a[pos:end] != b[pos:end]:
+            while a[pos] == b[pos]:
+                pos += 1
+            return pos
+        pos = end
+    return limit
+
+
+def common_suffix_length(a, b, limit):
+    """두 문자열의 공통 뒷부분 길이 (limit 를 넘지 않음)"""
+    length = 0
+    len_a, len_b = len(a), len(b)
+    while length < limit:
+        step = min(_COMPARE_STEP, limit - length)
+        if a[len_a - length - step:len_a - length] != b[len_b - length - step:len_b - length]:
+            while a[len_a - length - 1] == b[len_b - length - 1]:
+                length += 1
+            return length
+        length += step
+    return limit
+
+
+class IncrementalConverter:
+    """
+    직전 입력과 변환 결과를 블록 단위로 기억해 두고, 바뀐 부분만 다시 변환하는 변환기
+    update() 의 결과는 항상 eng_to_hangeul(text) 와 같습니다.
+    """
+
+    def __init__(self, block_size=DEFAULT_BLOCK_SIZE, convert=eng_to_hangeul):
+        self.block_size = block_size
+        self._convert = convert
+        self.reset()
+
+    def reset(self):
+        """기억한 입력과 결과를 비움"""
+        self.text = ''
+        self.output = ''
+        self._inputs = []    # 입력 블록 (마지막 블록 외에는 공백 문자로 끝남)
+        self._outputs = []   # 블록별 변환 결과
+        self._starts = []    # 블록별 입력 시작 위치
+        # 마지막 update 에서 다시 변환한 입력 길이 (확인/측정용)
+        self.last_reconverted = 0
+
+    def update(self, text):
+        """새 입력을 변환 (이전 입력과 달라진 공백 단위 구간만 다시 조합)"""
+        old = self.text
+        if text == old and self._inputs:
+            self.last_reconverted = 0
+            return self.output
+
+        metrics = active_metrics()
+        with metrics.timer('incremental.diff'):
+            prefix = common_prefix_length(old, text)
+            suffix = common_suffix_length(old, text, min(len(old), len(text)) - prefix)
+        old_end = len(old) - suffix  # 이전 입력에서 바뀐 구간의 끝 (미포함)
+
+        starts = self._starts
+        if not starts:
+            first, last = 0, -1
+        else:
+            # 바뀐 구간을 포함하는 블록들. 앞 블록은 바뀌지 않은 공백으로 끝나므로 그대로 둡니다.
+            first = max(bisect_right(starts, prefix) - 1, 0)
+            last = max(bisect_right(starts, max(old_end - 1, prefix)) - 1, first)
+            # 마지막 블록을 끝맺는 공백이 바뀐 구간 안에 있으면 다음 블록까지 넓힘
+            while last + 1 < len(starts) and starts[last + 1] - 1 < old_end:
+                last += 1
+
+        window_start = starts[first] if starts else 0
+        old_window_end = starts[last + 1] if last + 1 < len(starts) else len(old)
+        window_end = old_window_end + len(text) - len(old)
+        window = text[window_start:window_end]
+
+        metrics.observe_size('compose_chars', len(window))
+        with metrics.timer('compose'):
+            new_inputs = list(split_at_whitespace(window, self.block_size)) if window else []
+            new_outputs = [self._convert(piece) for piece in new_inputs]
+        metrics.count_transitions(window)
+        self._inputs[first:last + 1] = new_inputs
+        self._outputs[first:last + 1] = new_outputs
+
+        with metrics.timer('incremental.join'):
+            # 블록 시작 위치는 블록 수에 비례하는 비용으로 다시 계산
+            pos = 0
+            self._starts = new_starts = []
+            for piece in self._inputs:
+                new_starts.append(pos)
+                pos += len(piece)
+
+            self.text = text
+            self.output = "".join(self._outputs)
+        self.last_reconverted = len(window)
+        return self.output
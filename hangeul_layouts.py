@@ -0,0 +1,272 @@
+# --- 자판 배열 레지스트리 ---
+# 두벌식 외에 세벌식이나 사용자 정의 키 매핑으로도 변환할 수 있도록 자판을 이름으로 등록합니다.
+# 자판은 처음 쓸 때 한 번 키 → 조합 코드 테이블(CompiledLayout)로 컴파일되어 프로세스 안에서 재사용됩니다.
+# 컴파일은 자판 하나에 수십 µs 이므로 디스크에 캐시하지 않습니다 (캐시 파일을 읽는 쪽이 더 느림).
+#
+# 자판 종류
+#   dubeolsik: 키마다 자음 또는 모음 하나. 받침 여부는 뒤따르는 키로 정해집니다 (hangeul_core 조합기).
+#   sebeolsik: 초성/중성/종성 키가 따로 있음. 같은 초성 키를 두 번 누르면 된소리(ㄱ+ㄱ=ㄲ),
+#              종성 키 두 개는 겹받침(ㄹ+ㄱ=ㄺ)이 됩니다. 자모가 아닌 문자(숫자, 기호)를 내는 키도 둘 수 있습니다.
+# 키는 대소문자를 구분합니다. 두벌식 자판은 Shift 자모가 없는 대문자를 소문자 키로 처리합니다(fold_shift_keys).
+#
+# 사용 예:
+#   from hangeul_layouts import convert
+#   convert('jfshea', 'sebeolsik-390')   # → 안녕
+#   register_layout('my-layout', {...})
+import json
+
+from hangeul_core import (
+    CHOSUNG_LIST, JUNGSUNG_LIST, JONGSUNG_LIST, ENG_TO_JAMO, DOUBLE_CONSONANTS,
+    CHO_INDEX, JUNG_INDEX, JONG_INDEX, JUNG_COMBINE, EMPTY_STATE,
+    fold_shift_keys, build_key_table, compose_into, render_state,
+)
+
+DUBEOLSIK = 'dubeolsik'
+SEBEOLSIK = 'sebeolsik'
+DEFAULT_LAYOUT = 'dubeolsik'
+
+# 세벌식 조합 코드: 역할 * 32 + 자모 인덱스 (문자열이면 그 문자를 그대로 출력하는 키)
+_CHO, _JUNG, _JONG = 0, 1, 2
+_ROLES = {'cho': _CHO, 'jung': _JUNG, 'jong': _JONG}
+_ROLE_INDEX = {_CHO: CHO_INDEX, _JUNG: JUNG_INDEX, _JONG: JONG_INDEX}
+
+# 세벌식 전용 조합: 초성 두 번 → 된소리, 종성 + 종성 → 겹받침 (ㄱ+ㄱ=ㄲ, ㅅ+ㅅ=ㅆ 포함)
+SEBEOLSIK_DOUBLE_INITIALS = {'ㄱㄱ': 'ㄲ', 'ㄷㄷ': 'ㄸ', 'ㅂㅂ': 'ㅃ', 'ㅅㅅ': 'ㅆ', 'ㅈㅈ': 'ㅉ'}
+SEBEOLSIK_DOUBLE_FINALS = dict(DOUBLE_CONSONANTS, **{'ㄱㄱ': 'ㄲ', 'ㅅㅅ': 'ㅆ'})
+
+_N_CHO = len(CHOSUNG_LIST)
+_N_JUNG = len(JUNGSUNG_LIST)
+_N_JONG = len(JONGSUNG_LIST)
+
+# 초성 * 19 + 초성 → 된소리 초성 (-1 은 조합 불가)
+CHO_DOUBLE = [-1] * (_N_CHO * _N_CHO)
+for _pair, _jamo in SEBEOLSIK_DOUBLE_INITIALS.items():
+    CHO_DOUBLE[CHO_INDEX[_pair[0]] * _N_CHO + CHO_INDEX[_pair[1]]] = CHO_INDEX[_jamo]
+
+# 종성 * 28 + 종성 → 겹받침 (0 은 조합 불가)
+JONG_DOUBLE = [0] * (_N_JONG * _N_JONG)
+for _pair, _jamo in SEBEOLSIK_DOUBLE_FINALS.items():
+    JONG_DOUBLE[JONG_INDEX[_pair[0]] * _N_JONG + JONG_INDEX[_pair[1]]] = JONG_INDEX[_jamo]
+del _pair, _jamo
+
+# 세벌식 390 (영문 QWERTY 위치 기준). 값은 (역할, 자모) 또는 그대로 출력할 문자입니다.
+SEBEOLSIK_390 = {
+    # 숫자 줄
+    '1': ('jong', 'ㅎ'), '2': ('jong', 'ㅆ'), '3': ('jong', 'ㅂ'), '4': ('jung', 'ㅛ'), '5': ('jung', 'ㅠ'),
+    '6': ('jung', 'ㅑ'), '7': ('jung', 'ㅖ'), '8': ('jung', 'ㅢ'), '9': ('jung', 'ㅜ'), '0': ('cho', 'ㅋ'),
+    '!': ('jong', 'ㄲ'), '@': ('jong', 'ㄺ'), '#': ('jong', 'ㅈ'), '$': ('jong', 'ㄿ'), '%': ('jong', 'ㄾ'),
+    # 윗줄
+    'q': ('jong', 'ㅅ'), 'w': ('jong', 'ㄹ'), 'e': ('jung', 'ㅕ'), 'r': ('jung', 'ㅐ'), 't': ('jung', 'ㅓ'),
+    'y': ('cho', 'ㄹ'), 'u': ('cho', 'ㄷ'), 'i': ('cho', 'ㅁ'), 'o': ('cho', 'ㅊ'), 'p': ('cho', 'ㅍ'),
+    'Q': ('jong', 'ㅍ'), 'W': ('jong', 'ㅌ'), 'E': ('jong', 'ㄵ'), 'R': ('jong', 'ㅀ'), 'T': ('jong', 'ㄽ'),
+    'Y': '5', 'U': '6', 'I': '7', 'O': '8', 'P': '9',
+    # 가운뎃줄
+    'a': ('jong', 'ㅇ'), 's': ('jong', 'ㄴ'), 'd': ('jung', 'ㅣ'), 'f': ('jung', 'ㅏ'), 'g': ('jung', 'ㅡ'),
+    'h': ('cho', 'ㄴ'), 'j': ('cho', 'ㅇ'), 'k': ('cho', 'ㄱ'), 'l': ('cho', 'ㅈ'), ';': ('cho', 'ㅂ'),
+    "'": ('cho', 'ㅌ'),
+    'A': ('jong', 'ㄷ'), 'S': ('jong', 'ㄶ'), 'D': ('jong', 'ㄼ'), 'F': ('jong', 'ㄻ'), 'G': ('jung', 'ㅒ'),
+    'H': '0', 'J': '1', 'K': '2', 'L': '3', ':': '4',
+    # 아랫줄
+    'z': ('jong', 'ㅁ'), 'x': ('jong', 'ㄱ'), 'c': ('jung', 'ㅔ'), 'v': ('jung', 'ㅗ'), 'b': ('jung', 'ㅜ'),
+    'n': ('cho', 'ㅅ'), 'm': ('cho', 'ㅎ'), '/': ('jung', 'ㅗ'),
+    'Z': ('jong', 'ㅊ'), 'X': ('jong', 'ㅄ'), 'C': ('jong', 'ㅋ'), 'V': ('jong', 'ㄳ'),
+}
+
+
+class CompiledLayout:
+    """
+    컴파일된 자판: 키 → 조합 코드 테이블
+    두벌식은 hangeul_core.KEY_TABLE 과 같은 {키: (초성, 중성)} 형식이라 같은 조합기를 그대로 씁니다.
+    """
+
+    def __init__(self, name, kind, table):
+        self.name = name
+        self.kind = kind
+        self.table = table
+
+    def __repr__(self):
+        return f'CompiledLayout({self.name!r}, {self.kind!r}, {len(self.table)} keys)'
+
+    def compose_into(self, keys, state, result):
+        """hangeul_core.compose_into 와 같은 규약으로 이 자판의 키 입력을 조합 (상태를 반환)"""
+        if self.kind == SEBEOLSIK:
+            return compose_sebeolsik_into(keys, state, result, self.table)
+        return compose_into(keys, state, result, self.table)
+
+    def convert(self, text):
+        """키 입력 문자열을 이 자판 기준으로 한글로 변환"""
+        result = []
+        state = self.compose_into(text, EMPTY_STATE, result)
+        if state != EMPTY_STATE:
+            result.append(render_state(state))
+        return "".join(result)
+
+    __call__ = convert
+
+
+def compose_sebeolsik_into(keys, state, result, key_table):
+    """
+    세벌식 조합 상태 머신 (초성/중성/종성 키가 따로 있으므로 받침을 다음 글자로 넘기지 않음)
+    상태는 hangeul_core 와 같은 (초성, 중성, 종성) 이며, 마지막 글자는 확정하지 않고 반환합니다.
+    """
+    cho_double = CHO_DOUBLE
+    jung_combine = JUNG_COMBINE
+    jong_double = JONG_DOUBLE
+    append = result.append
+    cho, jung, jong = state
+
+    for char in keys:
+        entry = key_table.get(char, char)
+
+        if entry.__class__ is str:
+            # 자모가 아닌 키(또는 자판에 없는 문자)는 조합 중인 글자를 확정한 뒤 그대로 출력
+            if cho != -1 or jung != -1:
+                append(render_state((cho, jung, jong)))
+            append(entry)
+            cho, jung, jong = -1, -1, 0
+            continue
+
+        role = entry >> 5
+        index = entry & 31
+
+        if role == _CHO:
+            if jung == -1 and cho != -1:
+                doubled = cho_double[cho * _N_CHO + index]
+                if doubled != -1:
+                    cho = doubled
+                    continue
+            if cho != -1 or jung != -1:
+                append(render_state((cho, jung, jong)))
+            cho, jung, jong = index, -1, 0
+        elif role == _JUNG:
+            if jung == -1:
+                jung = index
+                continue
+            if jong == 0:
+                combined = jung_combine[jung * _N_JUNG + index]
+                if combined != -1:
+                    jung = combined
+                    continue
+            append(render_state((cho, jung, jong)))
+            cho, jung, jong = -1, index, 0
+        else:
+            if cho != -1 and jung != -1:
+                if jong == 0:
+                    jong = index
+                    continue
+                combined = jong_double[jong * _N_JONG + index]
+                if combined:
+                    jong = combined
+                    continue
+            # 초성과 중성이 모두 있는 글자에만 받침이 붙음. 그 외에는 단독 자모로 출력
+            if cho != -1 or jung != -1:
+                append(render_state((cho, jung, jong)))
+            append(JONGSUNG_LIST[index])
+            cho, jung, jong = -1, -1, 0
+
+    return cho, jung, jong
+
+
+# --- 레지스트리 ---
+
+LAYOUTS = {}      # 이름 → 자판 정의 {'kind': ..., 'keys': {...}, 'description': ...}
+_compiled = {}    # 이름 → CompiledLayout (프로세스 안 캐시)
+
+
+def register_layout(name, keys, kind=DUBEOLSIK, description=''):
+    """
+    자판을 등록 (같은 이름이 있으면 교체)
+    dubeolsik: keys 는 {키: 자모}
+    sebeolsik: keys 는 {키: (역할, 자모) 또는 출력 문자}, 역할은 'cho'/'jung'/'jong'
+    """
+    if kind not in (DUBEOLSIK, SEBEOLSIK):
+        raise ValueError(f"알 수 없는 자판 종류입니다: {kind}")
+    for key in keys:
+        # 공백은 글자 경계로 쓰이므로(병렬/증분 변환) 키가 될 수 없음
+        if len(key) != 1 or key.isspace():
+            raise ValueError(f"키는 공백이 아닌 한 글자여야 합니다: {key!r}")
+    # 자모 검사와 컴파일은 처음 get_layout 할 때
+    LAYOUTS[name] = {'kind': kind, 'keys': dict(keys), 'description': description}
+    _compiled.pop(name, None)
+
+
+def load_layout_file(path):
+    """
+    JSON 파일({"name", "kind", "keys", "description"})에서 사용자 정의 자판을 읽어 등록하고 이름을 반환
+    파일 형식이 맞지 않으면 ValueError
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: 자판 파일은 JSON 객체여야 합니다.")
+    name, kind, description = data.get('name'), data.get('kind', DUBEOLSIK), data.get('description', '')
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"{path}: \"name\" 은 비어 있지 않은 문자열이어야 합니다.")
+    if not isinstance(kind, str) or not isinstance(description, str):
+        raise ValueError(f"{path}: \"kind\" 와 \"description\" 은 문자열이어야 합니다.")
+    if not isinstance(data.get('keys'), dict):
+        raise ValueError(f"{path}: \"keys\" 는 {{키: 값}} 객체여야 합니다.")
+    keys = {}
+    for key, value in data['keys'].items():
+        # 두벌식은 "자모", 세벌식은 ["역할", "자모"] 또는 그대로 출력할 "문자"
+        if isinstance(value, list) and len(value) == 2 and all(isinstance(part, str) for part in value):
+            value = tuple(value)
+        elif not isinstance(value, str):
+            raise ValueError(f"{path}: 키 {key!r} 의 값이 올바르지 않습니다: {value!r}")
+        keys[key] = value
+    register_layout(name, keys, kind, description)
+    return name
+
+
+def available_layouts():
+    """등록된 자판 {이름: 설명}"""
+    return {name: definition['description'] for name, definition in LAYOUTS.items()}
+
+
+def _compile_table(definition):
+    """자판 정의를 조합 코드 테이블로 변환"""
+    keys = definition['keys']
+    if definition['kind'] == DUBEOLSIK:
+        for key, jamo in keys.items():
+            if jamo not in CHO_INDEX and jamo not in JUNG_INDEX:
+                raise ValueError(f"두벌식 키 {key!r} 의 자모가 올바르지 않습니다: {jamo!r}")
+        return build_key_table(fold_shift_keys(keys))
+
+    table = {}
+    for key, value in keys.items():
+        if isinstance(value, str):
+            table[key] = value
+            continue
+        role_name, jamo = value
+        role = _ROLES.get(role_name)
+        index = _ROLE_INDEX[role].get(jamo, -1) if role is not None else -1
+        if index < 0 or (role == _JONG and index == 0):
+            raise ValueError(f"세벌식 키 {key!r} 의 값이 올바르지 않습니다: {value!r}")
+        table[key] = role * 32 + index
+    return table
+
+
+def get_layout(name=DEFAULT_LAYOUT):
+    """
+    이름으로 컴파일된 자판을 반환 (프로세스 안에서는 한 번만 컴파일)
+    자판 정의에 잘못된 자모가 있으면 ValueError
+    """
+    layout = _compiled.get(name)
+    if layout is not None:
+        return layout
+    definition = LAYOUTS.get(name)
+    if definition is None:
+        raise KeyError(f"등록되지 않은 자판입니다: {name} (사용 가능: {', '.join(LAYOUTS)})")
+
+    table = _compile_table(definition)
+    layout = _compiled[name] = CompiledLayout(name, definition['kind'], table)
+    return layout
+
+
+def convert(text, layout=DEFAULT_LAYOUT):
+    """키 입력 문자열을 지정한 자판 기준으로 한글로 변환"""
+    return get_layout(layout).convert(text)
+
+
+register_layout(DUBEOLSIK, ENG_TO_JAMO, DUBEOLSIK, "두벌식 표준 (기본값)")
+register_layout('sebeolsik-390', SEBEOLSIK_390, SEBEOLSIK, "세벌식 390")
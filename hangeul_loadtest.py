@@ -0,0 +1,120 @@
+# --- 변환 서비스 부하 테스트 클라이언트 ---
+# hangeul_server.py 에 keep-alive 연결 여러 개로 요청을 보내 초당 요청 수와 지연 시간 분포를 측정합니다.
+#
+# 사용 예:
+#   python hangeul_loadtest.py --concurrency 16 --requests 20000
+#   python hangeul_loadtest.py --path /batch --batch 100
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_URL = 'http://127.0.0.1:8765'
+DEFAULT_TEXT = 'ehdgoanfrhk qorentksdl akfmrh ekfgehfhr'
+
+
+def build_request(host, path, text, batch):
+    """keep-alive 로 반복해서 보낼 요청 바이트"""
+    if batch:
+        body = json.dumps([text] * batch, ensure_ascii=False).encode('utf-8')
+        content_type = 'application/json'
+    else:
+        body = text.encode('utf-8')
+        content_type = 'text/plain; charset=utf-8'
+    head = (f'POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: {content_type}\r\n'
+            f'Content-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n')
+    return head.encode('latin-1') + body
+
+
+async def read_response(reader):
+    """응답 하나를 읽고 상태 코드를 반환 (Content-Length 응답만 지원)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("서버가 연결을 닫았습니다.")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, request, count, latencies, errors):
+    """연결 하나로 count 개의 요청을 차례로 보냄"""
+    reader, writer = await asyncio.open_connection(host, port)
+    clock = time.perf_counter
+    try:
+        for _ in range(count):
+            start = clock()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(clock() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값에서 백분위 값 (최근접 순위)"""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(url, path, text, batch, concurrency, requests):
+    """부하 테스트를 실행하고 결과 통계를 반환"""
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    request = build_request(host, path, text, batch)
+    latencies, errors = [], []
+    per_client = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, request, count, latencies, errors)
+                           for count in per_client if count))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'elapsed_sec': elapsed,
+        'requests_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="변환 서비스 부하 테스트")
+    parser.add_argument('--url', default=DEFAULT_URL, help="서버 주소 (기본값: %(default)s)")
+    parser.add_argument('--path', default='/convert', choices=['/convert', '/batch'], help="요청 경로")
+    parser.add_argument('--text', default=DEFAULT_TEXT, help="변환할 입력")
+    parser.add_argument('--batch', type=int, default=0,
+                        help="/batch 요청 하나에 담을 항목 수 (--path /batch 일 때, 기본값: 100)")
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help="동시 연결 수")
+    parser.add_argument('-n', '--requests', type=int, default=10000, help="전체 요청 수")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    batch = (args.batch or 100) if args.path == '/batch' else 0
+    result = asyncio.run(run(args.url, args.path, args.text, batch, args.concurrency, args.requests))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['requests']:,} requests in {result['elapsed_sec']:.2f}s "
+              f"({result['errors']} errors)")
+        print(f"{result['requests_per_sec']:,.0f} req/s  p50 {result['p50_ms']:.2f}ms  "
+              f"p90 {result['p90_ms']:.2f}ms  p99 {result['p99_ms']:.2f}ms  max {result['max_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
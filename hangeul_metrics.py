@@ -0,0 +1,227 @@
+# --- 변환 경로 계측 (선택 사항) ---
+# 변환 시간이 어디에 쓰이는지 보기 위한 가벼운 계측기입니다.
+#   - 단계별 타이머: 호출 수, 누적/최대 시간 (cache.lookup, compose, incremental.diff 등)
+#   - 상태 전이 카운터: 조합 상태 머신이 어떤 전이(받침, 복합 모음, 받침 넘김 등)를 몇 번 했는지
+#   - 입력 크기 히스토그램: 4배 간격 구간별 건수
+# 계측 지점은 변환 한 번에 한두 번만 호출되며, 꺼져 있으면 아무것도 하지 않는 공용 객체를 반환하므로
+# 비용은 호출당 속성 조회 몇 번뿐입니다. 글자 단위 조합 루프(compose_into)에는 계측 코드를 넣지 않습니다.
+# 상태 전이 집계는 같은 입력을 키 하나씩 다시 조합하며 세므로 비용이 크고, trace_transitions 를 켤 때만 동작합니다.
+#
+# 계측기는 컨텍스트별로 바꿔 쓸 수 있습니다 (Streamlit 은 세션마다 use_metrics 로 자기 계측기를 지정).
+#
+# 사용 예:
+#   from hangeul_metrics import METRICS
+#   METRICS.enabled = True
+#   ...
+#   print(METRICS.to_prometheus())
+import json
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+
+from hangeul_core import EMPTY_STATE, KEY_TABLE, compose_into
+
+# 입력 크기 히스토그램 구간 상한 (문자 수, 마지막 구간은 +Inf)
+SIZE_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# 상태 전이 이름
+TRANSITIONS = (
+    'cho',            # 빈 상태에 초성
+    'jung',           # 중성 (초성 뒤 또는 단독 모음)
+    'jong',           # 받침
+    'jung_combine',   # 복합 모음 (ㅗ + ㅏ = ㅘ)
+    'jong_combine',   # 복합 받침 (ㄹ + ㄱ = ㄺ)
+    'jong_split',     # 받침을 다음 글자 초성으로 넘김 (닭 + ㅏ = 달가)
+    'commit',         # 글자 완성 후 새 글자 시작
+    'other',          # 자모가 아닌 문자
+)
+
+
+class _NullTimer:
+    """계측이 꺼져 있을 때 쓰는 아무 일도 하지 않는 타이머"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ('_metrics', '_stage', '_start')
+
+    def __init__(self, metrics, stage):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._metrics.record_time(self._stage, time.perf_counter() - self._start)
+        return False
+
+
+def classify_transition(before, entry, after):
+    """키 하나의 조합 전후 상태로 상태 전이 이름을 정함 (entry 는 KEY_TABLE 값, 자모가 아니면 None)"""
+    if entry is None:
+        return 'other'
+    cho, jung, jong = before
+    key_cho, key_jung = entry
+    if key_jung == -1:
+        if jung == -1 and cho == -1:
+            return 'cho'
+        if jung != -1 and cho != -1 and after[:2] == (cho, jung):
+            return 'jong' if jong == 0 else 'jong_combine'
+        return 'commit'
+    if jung == -1:
+        return 'jung'
+    if jong:
+        return 'jong_split'
+    if after[0] == cho and after[1] != key_jung:
+        return 'jung_combine'
+    return 'commit'
+
+
+class Metrics:
+    """
+    단계별 타이머, 상태 전이 카운터, 크기 히스토그램을 모으는 계측기
+    enabled 가 거짓이면 모든 기록 메서드는 바로 반환합니다.
+    """
+
+    def __init__(self, enabled=False, trace_transitions=False):
+        self.enabled = enabled
+        self.trace_transitions = trace_transitions
+        self.reset()
+
+    def reset(self):
+        """모은 값을 모두 비움"""
+        self.timers = {}        # 단계 → [호출 수, 누적 초, 최대 초]
+        self.transitions = Counter()
+        self.histograms = {}    # 이름 → [구간별 건수..., +Inf 건수], 합계는 self.sums
+        self.sums = {}
+
+    # --- 기록 ---
+
+    def timer(self, stage):
+        """with 문으로 감싼 구간의 시간을 stage 이름으로 기록"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    def record_time(self, stage, seconds):
+        entry = self.timers.get(stage)
+        if entry is None:
+            self.timers[stage] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+    def observe_size(self, name, size):
+        """크기 하나를 히스토그램 name 에 기록"""
+        if not self.enabled:
+            return
+        counts = self.histograms.get(name)
+        if counts is None:
+            counts = self.histograms[name] = [0] * (len(SIZE_BUCKETS) + 1)
+            self.sums[name] = 0
+        counts[bisect_left(SIZE_BUCKETS, size)] += 1
+        self.sums[name] += size
+
+    def count_transitions(self, keys, key_table=KEY_TABLE):
+        """keys 를 조합할 때 일어나는 상태 전이를 셈 (trace_transitions 가 켜져 있을 때만, 입력 길이에 비례하는 비용)"""
+        if not (self.enabled and self.trace_transitions):
+            return
+        counts = self.transitions
+        state = EMPTY_STATE
+        sink = []
+        get = key_table.get
+        for char in keys:
+            after = compose_into(char, state, sink, key_table)
+            counts[classify_transition(state, get(char), after)] += 1
+            state = after
+            sink.clear()
+
+    # --- 내보내기 ---
+
+    def snapshot(self):
+        """현재 값을 JSON 으로 바꿀 수 있는 사전으로 반환"""
+        return {
+            'stages': {
+                stage: {'calls': calls, 'total_sec': total, 'avg_sec': total / calls, 'max_sec': peak}
+                for stage, (calls, total, peak) in sorted(self.timers.items())
+            },
+            'transitions': {name: self.transitions[name] for name in TRANSITIONS if self.transitions[name]},
+            'histograms': {
+                name: {
+                    'buckets': {str(bound): count for bound, count in zip(SIZE_BUCKETS + ('+Inf',), counts)},
+                    'count': sum(counts),
+                    'sum': self.sums[name],
+                }
+                for name, counts in sorted(self.histograms.items())
+            },
+        }
+
+    def to_json(self, indent=None):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix='hangeul'):
+        """Prometheus 텍스트 노출 형식"""
+        lines = [
+            f'# HELP {prefix}_stage_calls_total Number of timed calls per conversion stage.',
+            f'# TYPE {prefix}_stage_calls_total counter',
+        ]
+        lines += [f'{prefix}_stage_calls_total{{stage="{stage}"}} {calls}'
+                  for stage, (calls, _, _) in sorted(self.timers.items())]
+        lines += [
+            f'# HELP {prefix}_stage_seconds_total Time spent per conversion stage.',
+            f'# TYPE {prefix}_stage_seconds_total counter',
+        ]
+        lines += [f'{prefix}_stage_seconds_total{{stage="{stage}"}} {total:.9f}'
+                  for stage, (_, total, _) in sorted(self.timers.items())]
+        lines += [
+            f'# HELP {prefix}_stage_max_seconds Slowest single call per conversion stage.',
+            f'# TYPE {prefix}_stage_max_seconds gauge',
+        ]
+        lines += [f'{prefix}_stage_max_seconds{{stage="{stage}"}} {peak:.9f}'
+                  for stage, (_, _, peak) in sorted(self.timers.items())]
+        lines += [
+            f'# HELP {prefix}_transitions_total Composition state machine transitions.',
+            f'# TYPE {prefix}_transitions_total counter',
+        ]
+        lines += [f'{prefix}_transitions_total{{transition="{name}"}} {self.transitions[name]}'
+                  for name in TRANSITIONS if self.transitions[name]]
+        for name, counts in sorted(self.histograms.items()):
+            metric = f'{prefix}_{name}'
+            lines += [f'# HELP {metric} Size distribution ({name}).', f'# TYPE {metric} histogram']
+            cumulative = 0
+            for bound, count in zip(SIZE_BUCKETS + ('+Inf',), counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum {self.sums[name]}')
+            lines.append(f'{metric}_count {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+# 기본 계측기 (꺼져 있음)
+METRICS = Metrics()
+
+_active = ContextVar('hangeul_metrics', default=METRICS)
+
+
+def active_metrics():
+    """현재 컨텍스트의 계측기 (지정하지 않았으면 METRICS)"""
+    return _active.get()
+
+
+def use_metrics(metrics):
+    """현재 컨텍스트(스레드/작업)의 계측기를 지정하고 되돌릴 때 쓸 토큰을 반환"""
+    return _active.set(metrics)
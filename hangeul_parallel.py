@@ -0,0 +1,138 @@
+# --- 프로세스 풀 병렬 변환 ---
+# 글자 조합은 공백을 넘지 않으므로, 입력을 공백 뒤에서 잘라 여러 프로세스에 나눠 변환한 뒤
+# 순서대로 이어 붙이면 eng_to_hangeul 한 번과 같은 결과가 됩니다.
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from hangeul_core import EMPTY_STATE, compose_into, eng_to_hangeul, render_state
+
+DEFAULT_CHUNK_SIZE = 256 * 1024      # 작업 하나당 문자 수
+DEFAULT_MIN_PARALLEL_SIZE = 1 << 20  # 이보다 짧은 입력은 풀 시작 비용이 더 크므로 단일 프로세스로 변환
+
+# 공백 없는 부분 (뒤집은 조각의 앞에 맞춰 마지막 공백 위치를 찾음)
+_NON_SPACE = re.compile(r'\S*')
+
+
+def default_workers():
+    """사용할 작업 프로세스 수 (CPU 코어 수)"""
+    return os.cpu_count() or 1
+
+
+def split_at_whitespace(text, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    text 를 약 chunk_size 길이의 조각으로 나눔 (각 조각은 공백 문자 바로 뒤에서 끝남)
+    chunk_size 안에 공백이 없으면 다음 공백까지 조각을 늘립니다.
+    """
+    start = 0
+    length = len(text)
+    while start < length:
+        end = start + chunk_size
+        if end >= length:
+            yield text[start:]
+            return
+        cut = end
+        while cut > start and not text[cut - 1].isspace():
+            cut -= 1
+        if cut == start:
+            cut = end
+            while cut < length and not text[cut - 1].isspace():
+                cut += 1
+        yield text[start:cut]
+        start = cut
+
+
+def rebuffer_at_whitespace(chunks, max_carry=DEFAULT_CHUNK_SIZE):
+    """
+    임의 위치에서 잘린 텍스트 조각들을 공백 뒤에서 끝나도록 다시 잘라 (조각, 공백에서 끝나는지) 를 내보냄
+    마지막 토큰은 다음 조각으로 넘기되, 공백 없이 max_carry 문자를 넘게 이어지면 더 모으지 않고
+    거짓과 함께 내보냅니다 (받는 쪽이 조합 상태를 이어서 변환해야 함). 입력의 마지막 조각은 참입니다.
+    """
+    carry = []
+    carry_size = 0
+    for chunk in chunks:
+        # 새 조각 안에서만 마지막 공백을 찾음 (넘겨 온 부분에는 공백이 없음)
+        cut = len(chunk) - _NON_SPACE.match(chunk[::-1]).end()
+        if cut:
+            carry.append(chunk[:cut])
+            yield ''.join(carry), True
+            carry = [chunk[cut:]]
+            carry_size = len(chunk) - cut
+        else:
+            carry.append(chunk)
+            carry_size += len(chunk)
+            if carry_size > max_carry:
+                yield ''.join(carry), False
+                carry = []
+                carry_size = 0
+    if carry_size:
+        yield ''.join(carry), True
+
+
+def _completed(result):
+    """이미 구한 결과를 map_ordered 의 대기열에 넣기 위한 완료된 Future"""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def map_ordered(executor, pieces, max_pending, convert=eng_to_hangeul, compose=compose_into):
+    """
+    executor 로 조각을 변환하되, 동시에 진행 중인 작업을 max_pending 개로 제한하며 순서대로 결과를 내보냄
+    pieces 는 rebuffer_at_whitespace 의 (조각, 공백에서 끝나는지) 이며, 공백 없이 길게 이어지는 부분은
+    compose 로 상태를 넘기며 이 프로세스에서 차례로 조합합니다 (compose 가 None 이면 convert 가 글자 단위 변환).
+    """
+    pending = deque()
+    state = None    # 길게 이어지는 토큰을 조합하는 중이면 그 상태
+    for piece, complete in pieces:
+        if compose is not None and (state is not None or not complete):
+            out = []
+            state = compose(piece, EMPTY_STATE if state is None else state, out)
+            if complete:
+                out.append(render_state(state))
+                state = None
+            future = _completed(''.join(out))
+        elif executor is None:
+            future = _completed(convert(piece))
+        else:
+            future = executor.submit(convert, piece)
+        pending.append(future)
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def convert_parallel(text, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     min_parallel_size=DEFAULT_MIN_PARALLEL_SIZE, convert=eng_to_hangeul):
+    """
+    큰 문서를 여러 프로세스로 나눠 변환 (결과는 convert(text) 와 같음)
+    convert 는 공백을 넘는 상태가 없는 모듈 최상위 함수여야 합니다 (eng_to_hangeul, hangeul_to_eng).
+    """
+    if workers is None:
+        workers = default_workers()
+    if workers <= 1 or len(text) < min_parallel_size:
+        return convert(text)
+
+    pieces = list(split_at_whitespace(text, chunk_size))
+    if len(pieces) == 1:
+        return convert(text)
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(pieces))) as executor:
+        return "".join(executor.map(convert, pieces))
+
+
+def iter_convert_parallel(chunks, workers=None, convert=eng_to_hangeul, compose=compose_into):
+    """
+    스트림 조각들을 공백 단위로 다시 잘라 여러 프로세스에서 변환 (메모리는 작업 프로세스 수에 비례)
+    compose 는 convert 와 같은 자판의 compose_into 규약 함수이며, 상태가 없는 변환(hangeul_to_eng)이면 None 입니다.
+    """
+    if workers is None:
+        workers = default_workers()
+    pieces = rebuffer_at_whitespace(chunks)
+    if workers <= 1:
+        yield from map_ordered(None, pieces, 1, convert, compose)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from map_ordered(executor, pieces, workers * 2, convert, compose)
@@ -0,0 +1,262 @@
+# --- 초성/자모 검색 색인 ---
+# 변환한 한글 텍스트를 한국어 사용자가 기대하는 방식으로 찾기 위한 색인입니다.
+#   - 초성 검색: ㄷㅎㅁ → 동해물
+#   - 초성과 글자 섞기: 동ㅎㅁ → 동해물
+#   - 입력 중인 마지막 글자: 해무 → 해물, 고 → 과, 달 → 닭, 값 → 갑시다 (받침이 다음 글자 초성이 되는 경우)
+#
+# 문서마다 글자별 초성 인덱스(완성형 글자를 588/28 로 분해, 한글이 아니면 255)를 한 바이트씩 담은 bytes 를 만들고,
+# 초성 1~3글자 n-gram 과 문서에 나오는 글자 → 문서 번호 목록(array('I'))의 역색인을 둡니다. 검색은 질의의
+# 초성 n-gram 과 그대로 맞아야 하는 글자 중 문서 수가 가장 적은 것으로 후보를 좁힌 뒤,
+# 후보 문서의 초성 bytes 에서 bytes.find 로 위치를 찾고
+# 그 위치의 글자를 분해해 확인합니다. 문서 추가는 역색인 목록 끝에 덧붙이기만 하므로 다시 만들 필요가 없습니다.
+#
+# 사용 예:
+#   python hangeul_search.py corpus.ko.txt -q ㄷㅎㅁ -q 해무
+#   python hangeul_search.py typed.txt --keys -q ㅇㄴㅎㅅㅇ   # 영타 파일은 변환해서 색인
+import argparse
+import heapq
+import re
+import sys
+import time
+from array import array
+
+from hangeul_core import (
+    JUNGSUNG_LIST, JONGSUNG_LIST, HANGEUL_BASE, HANGEUL_SYLLABLE_COUNT,
+    DOUBLE_VOWELS, DOUBLE_CONSONANTS, CHO_INDEX, JONG_SPLIT, decompose_syllable, eng_to_hangeul,
+)
+
+NOT_HANGEUL = 255
+_NOT_HANGEUL_BYTE = bytes([NOT_HANGEUL])
+MAX_GRAM = 3
+DEFAULT_LIMIT = 20
+
+# 코드포인트 → 초성 인덱스 문자 (str.translate 용 리스트, 한글이 아닌 문자는 255)
+_CHO_TRANSLATE = ['\xff'] * (HANGEUL_BASE + HANGEUL_SYLLABLE_COUNT)
+for _code in range(HANGEUL_SYLLABLE_COUNT):
+    _CHO_TRANSLATE[HANGEUL_BASE + _code] = chr(_code // 588)
+for _jamo, _cho in CHO_INDEX.items():
+    _CHO_TRANSLATE[ord(_jamo)] = chr(_cho)  # 단독 자음(ㅋㅋ 등)도 초성으로 취급
+del _code, _jamo, _cho
+
+# 완성형 한글 뒤의 문자 (translate 표 밖이라 먼저 255 로 바꿈)
+_BEYOND_TABLE = re.compile('[\ud7a4-\U0010ffff]')
+
+# 입력 중인 글자의 중성/종성이 더 이어질 수 있는 관계 (ㅗ → ㅘ, ㄹ → ㄺ)
+_JUNG_EXTENDS = {}
+for _pair, _jamo in DOUBLE_VOWELS.items():
+    _JUNG_EXTENDS.setdefault(JUNGSUNG_LIST.index(_pair[0]), set()).add(JUNGSUNG_LIST.index(_jamo))
+_JONG_EXTENDS = {}
+for _pair, _jamo in DOUBLE_CONSONANTS.items():
+    _JONG_EXTENDS.setdefault(JONGSUNG_LIST.index(_pair[0]), set()).add(JONGSUNG_LIST.index(_jamo))
+del _pair, _jamo
+
+
+def choseong_bytes(text):
+    """문자열의 글자별 초성 인덱스 (한글 글자/단독 자음이 아니면 255), 길이는 len(text) 와 같음"""
+    if text and max(text) >= '\ud7a4':
+        text = _BEYOND_TABLE.sub('\xff', text)
+    return text.translate(_CHO_TRANSLATE).encode('latin-1')
+
+
+def _syllable_prefix_matches(query, target):
+    """입력 중인 글자 query 가 target 글자로 이어질 수 있는지 (해무 → 물, 고 → 과, 달 → 닭)"""
+    q = decompose_syllable(query)
+    t = decompose_syllable(target)
+    if t is None or q[0] != t[0]:
+        return False
+    if q[2] == 0:
+        return q[1] == t[1] or t[1] in _JUNG_EXTENDS.get(q[1], ())
+    return q[1] == t[1] and (q[2] == t[2] or t[2] in _JONG_EXTENDS.get(q[2], ()))
+
+
+def _merge_unique(postings):
+    """정렬된 문서 번호 목록들을 겹치는 번호 없이 차례로 (검색이 limit 에서 멈추도록 지연 병합)"""
+    previous = -1
+    for doc_id in heapq.merge(*postings):
+        if doc_id != previous:
+            yield doc_id
+            previous = doc_id
+
+
+class _Query:
+    """검색어를 미리 분해해 둔 것: 초성 패턴과 글자별 확인 규칙"""
+
+    def __init__(self, text):
+        self.text = text
+        self.pattern = choseong_bytes(text)
+        # 마지막 글자의 받침이 다음 글자의 초성으로 넘어가는 경우 (값 → 갑ㅅ): (받침 뺀 글자, 다음 초성)
+        self.split = None
+        last = decompose_syllable(text[-1]) if text else None
+        if last is not None and last[2]:
+            rest, next_cho = JONG_SPLIT[last[2]]
+            self.split = (chr(HANGEUL_BASE + last[0] * 588 + last[1] * 28 + rest), next_cho)
+        # 그대로 맞아야 하는 글자 (초성만 입력한 자리와 입력 중인 마지막 한글 글자 제외)
+        exact = text if last is None else text[:-1]
+        self.chars = {char for char in exact if char not in CHO_INDEX}
+        # 입력 중인 마지막 한글 글자가 될 수 있는 글자들 (드문 글자면 초성 n-gram 보다 후보가 적음)
+        self.completions = None
+        if last is not None:
+            cho, jung, jong = last
+            if jong == 0:
+                pairs = [(j, t) for j in {jung} | _JUNG_EXTENDS.get(jung, set()) for t in range(28)]
+            else:
+                pairs = [(jung, t) for t in {jong} | _JONG_EXTENDS.get(jong, set())]
+            self.completions = [chr(HANGEUL_BASE + cho * 588 + j * 28 + t) for j, t in pairs]
+            if self.split is not None:
+                self.completions.append(self.split[0])
+
+    def grams(self):
+        """색인을 찾아볼 초성 n-gram 들 (한글이 아닌 자리는 색인하지 않으므로 제외)"""
+        pattern = self.pattern
+        size = min(MAX_GRAM, len(pattern))
+        for gram_size in range(size, 0, -1):
+            grams = [pattern[i:i + gram_size] for i in range(len(pattern) - gram_size + 1)]
+            grams = [gram for gram in grams if NOT_HANGEUL not in gram]
+            if grams:
+                return grams
+        return []
+
+    def match_at(self, text, cho, pos):
+        """text 의 pos 위치에서 검색어가 맞으면 끝 위치, 아니면 -1 (초성은 이미 맞는 자리)"""
+        query = self.text
+        last = len(query) - 1
+        for i, char in enumerate(query):
+            target = text[pos + i]
+            if char == target or char in CHO_INDEX:
+                continue  # 같은 글자, 또는 초성만 입력한 자리
+            if i == last and _syllable_prefix_matches(char, target):
+                continue
+            if i == last and self.split is not None:
+                rest, next_cho = self.split
+                end = pos + i + 1
+                if target == rest and end < len(cho) and cho[end] == next_cho:
+                    return end + 1
+            return -1
+        return pos + len(query)
+
+
+class ChoseongIndex:
+    """
+    초성/자모 검색 색인
+    add() 로 문서를 하나씩 추가하며, search() 는 (문서 번호, 시작, 끝) 목록을 반환합니다.
+    """
+
+    def __init__(self, texts=()):
+        self.texts = []
+        self._cho = []
+        self._postings = {}   # 초성 n-gram(bytes) → 문서 번호 array('I')
+        for text in texts:
+            self.add(text)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add(self, text):
+        """문서 하나를 추가하고 문서 번호를 반환 (기존 색인은 다시 만들지 않음)"""
+        doc_id = len(self.texts)
+        cho = choseong_bytes(text)
+        self.texts.append(text)
+        self._cho.append(cho)
+
+        postings = self._postings
+        keys = set(text)   # 글자(str)와 초성 n-gram(bytes)은 키 종류가 달라 섞이지 않음
+        for run in cho.split(_NOT_HANGEUL_BYTE):
+            length = len(run)
+            for size in range(1, min(MAX_GRAM, length) + 1):
+                keys.update([run[i:i + size] for i in range(length - size + 1)])
+        for key in keys:
+            posting = postings.get(key)
+            if posting is None:
+                posting = postings[key] = array('I')
+            posting.append(doc_id)
+        return doc_id
+
+    def extend(self, texts):
+        for text in texts:
+            self.add(text)
+
+    def _candidates(self, query):
+        """
+        후보 문서 번호: 질의의 초성 n-gram 과 그대로 맞아야 하는 글자 중 문서 수가 가장 적은 목록
+        (마지막 글자가 될 수 있는 글자들의 목록을 합친 쪽이 더 적으면 그것)
+        """
+        keys = query.grams() + sorted(query.chars)
+        if not keys:
+            return range(len(self.texts))
+        postings = self._postings
+        best = None
+        for key in keys:
+            posting = postings.get(key)
+            if posting is None:
+                return ()
+            if best is None or len(posting) < len(best):
+                best = posting
+        if query.completions is not None:
+            lists = [postings[char] for char in query.completions if char in postings]
+            if sum(map(len, lists)) < len(best):
+                return _merge_unique(lists)
+        return best
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """검색어와 맞는 (문서 번호, 시작, 끝) 목록 (문서마다 첫 위치, 최대 limit 개)"""
+        if not text:
+            return []
+        query = _Query(text)
+        pattern = query.pattern
+        results = []
+        for doc_id in self._candidates(query):
+            doc_text = self.texts[doc_id]
+            cho = self._cho[doc_id]
+            pos = cho.find(pattern)
+            while pos != -1:
+                end = query.match_at(doc_text, cho, pos)
+                if end != -1:
+                    results.append((doc_id, pos, end))
+                    break
+                pos = cho.find(pattern, pos + 1)
+            if len(results) >= limit:
+                break
+        return results
+
+    def stats(self):
+        """문서 수와 역색인 크기"""
+        return {
+            'documents': len(self.texts),
+            'keys': len(self._postings),
+            'postings': sum(len(posting) for posting in self._postings.values()),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한글 텍스트 파일을 줄 단위로 초성/자모 검색합니다.")
+    parser.add_argument('input', help="색인할 파일 (한 줄이 한 문서, '-' 는 표준 입력)")
+    parser.add_argument('-q', '--query', action='append', required=True, help="검색어 (여러 번 지정 가능)")
+    parser.add_argument('--keys', action='store_true', help="입력이 영타이면 한글로 변환한 뒤 색인")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help="검색어마다 보여줄 결과 수")
+    parser.add_argument('--encoding', default='utf-8', help="입력 인코딩 (기본값: %(default)s)")
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.input == '-' else open(args.input, encoding=args.encoding)
+    index = ChoseongIndex()
+    start = time.perf_counter()
+    try:
+        for line in src:
+            line = line.rstrip('\n')
+            index.add(eng_to_hangeul(line) if args.keys else line)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+    print(f"# {len(index):,} documents indexed in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    for text in args.query:
+        start = time.perf_counter()
+        results = index.search(text, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{text}: {len(results)} results ({elapsed:.3f}ms)")
+        for doc_id, begin, end in results:
+            line = index.texts[doc_id]
+            print(f"  {doc_id + 1}: {line[:begin]}[{line[begin:end]}]{line[end:]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+# --- 로컬 HTTP 변환 서비스 (asyncio) ---
+# 다른 서비스에서 변환기를 호출할 수 있도록 표준 라이브러리만으로 만든 작은 HTTP/1.1 서버입니다.
+# 연결은 keep-alive 로 유지되며, 큰 입력이나 배치는 프로세스 풀에서 변환해 이벤트 루프를 막지 않습니다.
+#
+#   POST /convert   본문 텍스트 → 변환된 텍스트 (application/json 이면 {"text": ...} → {"result": ...})
+#   GET  /convert?text=...
+#   POST /batch     JSON 배열 → JSON 배열
+#                   application/x-ndjson 이면 한 줄씩 변환해 NDJSON 으로 스트리밍 응답 (chunked)
+#   GET  /healthz
+#
+# 사용 예:
+#   python hangeul_server.py --port 8765 --workers 4
+#   curl -d 'dkssudgktpdy' http://127.0.0.1:8765/convert
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from hangeul_core import eng_to_hangeul
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_INLINE_LIMIT = 64 * 1024   # 이보다 작은 작업은 이벤트 루프에서 바로 변환 (문자 수)
+DEFAULT_BATCH_SIZE = 256           # 풀에 한 번에 보내는 배치 항목 수
+MAX_BODY_BYTES = 64 << 20
+KEEPALIVE_TIMEOUT = 15.0
+
+
+class HTTPError(Exception):
+    """클라이언트에 오류 응답을 보내야 하는 요청"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _StreamAborted(Exception):
+    """스트리밍 응답을 보내던 중 실패 (상태 줄은 이미 나갔으므로 연결을 끊는 것 외에는 알릴 방법이 없음)"""
+
+
+def convert_many(texts):
+    """여러 입력을 차례로 변환 (프로세스 풀 작업 단위)"""
+    return [eng_to_hangeul(text) for text in texts]
+
+
+def _parse_batch_item(item):
+    """배치 항목 하나에서 입력 문자열 꺼내기 (문자열 또는 {"text": ...})"""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict) and isinstance(item.get('text'), str):
+        return item['text']
+    raise HTTPError(HTTPStatus.BAD_REQUEST, "배치 항목은 문자열이거나 {\"text\": 문자열} 이어야 합니다.")
+
+
+class ConversionServer:
+    """변환 요청을 처리하는 asyncio HTTP 서버"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None,
+                 inline_limit=DEFAULT_INLINE_LIMIT, batch_size=DEFAULT_BATCH_SIZE):
+        self.host = host
+        self.port = port
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.inline_limit = inline_limit
+        self.batch_size = batch_size
+        self.pool = None
+        self.requests = 0
+
+    # --- 변환 ---
+
+    def _use_pool(self, texts):
+        return self.pool is not None and sum(map(len, texts)) >= self.inline_limit
+
+    def _submit(self, texts):
+        """입력 목록을 배치로 나눠 풀에 보내고 배치별 future 목록 반환"""
+        loop = asyncio.get_running_loop()
+        return [loop.run_in_executor(self.pool, convert_many, texts[i:i + self.batch_size])
+                for i in range(0, len(texts), self.batch_size)]
+
+    async def convert_texts(self, texts):
+        """입력 목록을 변환 (작으면 바로, 크면 프로세스 풀에서)"""
+        if not self._use_pool(texts):
+            return convert_many(texts)
+        results = []
+        for batch in await asyncio.gather(*self._submit(texts)):
+            results.extend(batch)
+        return results
+
+    # --- 요청 처리 ---
+
+    async def handle_convert(self, method, query, headers, body):
+        if method == 'GET':
+            texts = query.get('text', [''])[:1]
+            as_json = False
+        elif headers.get('content-type', '').startswith('application/json'):
+            payload = self._load_json(body)
+            if not isinstance(payload, dict) or not isinstance(payload.get('text'), str):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "{\"text\": 문자열} 형식이어야 합니다.")
+            texts = [payload['text']]
+            as_json = True
+        else:
+            texts = [self._decode(body)]
+            as_json = False
+
+        result, = await self.convert_texts(texts)
+        if as_json:
+            return 'application/json', self._dump({'result': result})
+        return 'text/plain; charset=utf-8', result.encode('utf-8')
+
+    async def handle_batch(self, headers, body):
+        payload = self._load_json(body)
+        if not isinstance(payload, list):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "JSON 배열이어야 합니다.")
+        results = await self.convert_texts([_parse_batch_item(item) for item in payload])
+        return 'application/json', self._dump(results)
+
+    async def stream_ndjson(self, writer, body, keep_alive):
+        """NDJSON 배치: 결과가 준비되는 대로 한 줄씩 chunked 응답으로 보냄 (입력 순서 유지)"""
+        items = []
+        for line in self._decode(body).splitlines():
+            if line.strip():
+                items.append(self._load_json(line))
+        texts = [_parse_batch_item(item) for item in items]
+
+        if self._use_pool(texts):
+            batches = self._submit(texts)
+        else:
+            batches = [convert_many(texts)]
+        writer.write(self._head(HTTPStatus.OK, 'application/x-ndjson', None, keep_alive))
+        try:
+            await self._write_ndjson_chunks(writer, items, batches)
+        except ConnectionError:
+            raise
+        except Exception as error:
+            for batch in batches:
+                if not isinstance(batch, list):
+                    batch.cancel()
+            raise _StreamAborted(repr(error)) from error
+
+    async def _write_ndjson_chunks(self, writer, items, batches):
+        """배치 결과를 차례로 기다려 NDJSON 줄을 chunk 로 쓰고 마지막 chunk 로 끝냄"""
+        index = 0
+        for batch in batches:
+            if not isinstance(batch, list):
+                batch = await batch
+            lines = []
+            for result in batch:
+                item = items[index]
+                record = {'result': result}
+                if isinstance(item, dict) and 'id' in item:
+                    record = {'id': item['id'], 'result': result}
+                lines.append(json.dumps(record, ensure_ascii=False))
+                index += 1
+            if lines:
+                chunk = ('\n'.join(lines) + '\n').encode('utf-8', 'backslashreplace')
+                writer.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                await writer.drain()
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    async def dispatch(self, writer, method, target, headers, body, keep_alive):
+        """요청 하나를 처리해 응답을 씀"""
+        url = urlsplit(target)
+        path = url.path
+        if path == '/healthz':
+            content_type, payload = 'application/json', self._dump({'status': 'ok', 'requests': self.requests})
+        elif path == '/convert' and method in ('GET', 'POST'):
+            content_type, payload = await self.handle_convert(method, parse_qs(url.query), headers, body)
+        elif path == '/batch' and method == 'POST':
+            if headers.get('content-type', '').startswith('application/x-ndjson'):
+                await self.stream_ndjson(writer, body, keep_alive)
+                return
+            content_type, payload = await self.handle_batch(headers, body)
+        else:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"{method} {path} 는 지원하지 않습니다.")
+        writer.write(self._head(HTTPStatus.OK, content_type, len(payload), keep_alive) + payload)
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        """연결 하나에서 keep-alive 로 여러 요청을 차례로 처리"""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version, length = self._parse_head(request_line, headers)
+                except HTTPError as error:
+                    self._write_error(writer, error, False)
+                    await writer.drain()
+                    break
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                if length > MAX_BODY_BYTES:
+                    self._write_error(writer, HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "본문이 너무 큽니다."), False)
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.requests += 1
+                try:
+                    await self.dispatch(writer, method.upper(), target, headers, body, keep_alive)
+                except HTTPError as error:
+                    self._write_error(writer, error, keep_alive)
+                    await writer.drain()
+                except _StreamAborted:
+                    # chunked 본문 중간에 다른 응답을 쓸 수 없으므로 마지막 chunk 없이 연결을 끊어 실패를 알림
+                    break
+                except Exception as error:  # 변환 작업 실패 등: 500 응답 후 연결 종료
+                    self._write_error(writer, HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, repr(error)), False)
+                    await writer.drain()
+                    break
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_head(request_line, headers):
+        """요청 줄과 Content-Length 해석: (메서드, 대상, HTTP 버전, 본문 길이), 형식이 틀리면 400"""
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "요청 줄 형식이 잘못되었습니다.")
+        method, target, version = parts
+        value = headers.get('content-length', '0')
+        if not (value.isascii() and value.isdigit()):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Content-Length 가 잘못되었습니다: {value!r}")
+        return method, target, version, int(value)
+
+    # --- 응답 도우미 ---
+
+    @staticmethod
+    def _head(status, content_type, length, keep_alive):
+        """응답 상태 줄과 헤더 (length 가 None 이면 chunked)"""
+        lines = [f'HTTP/1.1 {status.value} {status.phrase}', f'Content-Type: {content_type}']
+        if length is None:
+            lines.append('Transfer-Encoding: chunked')
+        else:
+            lines.append(f'Content-Length: {length}')
+        lines.append('Connection: keep-alive' if keep_alive else 'Connection: close')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    def _write_error(self, writer, error, keep_alive):
+        payload = self._dump({'error': str(error)})
+        writer.write(self._head(error.status, 'application/json', len(payload), keep_alive) + payload)
+
+    @staticmethod
+    def _decode(body):
+        try:
+            return body.decode('utf-8')
+        except UnicodeDecodeError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "본문은 UTF-8 이어야 합니다.")
+
+    def _load_json(self, body):
+        try:
+            return json.loads(body if isinstance(body, str) else self._decode(body))
+        except json.JSONDecodeError as error:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"JSON 형식 오류: {error}")
+
+    @staticmethod
+    def _dump(payload):
+        # 짝 없는 서로게이트는 UTF-8 로 쓸 수 없으므로 JSON 이스케이프(\ud800)로 씀
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8', 'backslashreplace')
+
+    # --- 실행 ---
+
+    async def serve(self, ready=None):
+        """서버를 시작하고 취소될 때까지 요청을 처리 (ready 이벤트가 있으면 시작 후 설정)"""
+        if self.workers > 1:
+            # fork 로 만든 작업 프로세스는 처음 작업이 들어올 때 열려 있던 클라이언트 소켓을 물려받아
+            # 그 연결이 닫히지 않으므로, 소켓을 물려받지 않는 방식으로 시작
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        try:
+            server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+            self.port = server.sockets[0].getsockname()[1]
+            if ready is not None:
+                ready.set()
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown(cancel_futures=True)
+                self.pool = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="영타 → 한글 변환 로컬 HTTP 서비스")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="바인드 주소 (기본값: %(default)s)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="포트 (기본값: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="큰 작업용 프로세스 수 (기본값: CPU 코어 수, 1 이면 풀 없이 동작)")
+    parser.add_argument('--inline-limit', type=int, default=DEFAULT_INLINE_LIMIT,
+                        help="이 문자 수보다 작은 작업은 이벤트 루프에서 바로 변환 (기본값: %(default)s)")
+    args = parser.parse_args(argv)
+
+    server = ConversionServer(args.host, args.port, args.workers, args.inline_limit)
+    print(f"listening on http://{args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# --- 대용량 파일용 스트리밍 변환기 (명령줄) ---
+# 입력을 일정 크기 조각으로 읽어 변환 즉시 출력합니다.
+# 조각 사이에는 조합 중인 한 글자 상태만 넘기므로, 파일 크기와 상관없이 메모리 사용량이 일정합니다.
+#
+# 사용 예:
+#   python hangeul_stream.py chat.log -o chat.ko.log
+#   cat search.log | python hangeul_stream.py > search.ko.log
+#   python hangeul_stream.py --reverse korean.txt   # 한글 → 두벌식 키 입력
+#   python hangeul_stream.py --layout sebeolsik-390 typed.txt
+import argparse
+import codecs
+import mmap
+import sys
+
+from hangeul_core import EMPTY_STATE, compose_into, render_state, hangeul_to_eng
+from hangeul_layouts import DEFAULT_LAYOUT, LAYOUTS, get_layout, load_layout_file
+from hangeul_parallel import iter_convert_parallel
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1M 문자
+
+
+def convert_chunks(chunks, compose=compose_into):
+    """
+    텍스트 조각을 차례로 변환하여 확정된 결과를 내보내는 제너레이터
+    조각 경계는 글자 경계로만 취급되며, 조합 중인 글자는 다음 조각으로 이어집니다.
+    compose 는 compose_into 와 같은 규약의 조합 함수입니다 (다른 자판은 CompiledLayout.compose_into).
+    """
+    state = EMPTY_STATE
+    for chunk in chunks:
+        pieces = []
+        state = compose(chunk, state, pieces)
+        if pieces:
+            yield "".join(pieces)
+    tail = render_state(state)
+    if tail:
+        yield tail
+
+
+def reverse_chunks(chunks):
+    """텍스트 조각을 차례로 두벌식 키 입력으로 역변환 (글자 단위 변환이라 조각 사이에 상태가 없음)"""
+    for chunk in chunks:
+        yield hangeul_to_eng(chunk)
+
+
+def read_chunks(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """텍스트 스트림을 chunk_size 문자 단위로 읽음"""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_mmap_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """로컬 파일을 mmap 으로 열어 chunk_size 바이트 단위로 디코딩 (멀티바이트 문자는 다음 조각으로 이어짐)"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, 'rb') as f:
+        # 빈 파일은 mmap 할 수 없음
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, len(mm), chunk_size):
+                chunk = decoder.decode(mm[start:start + chunk_size])
+                if chunk:
+                    yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def convert_stream(src, dst, chunk_size=DEFAULT_CHUNK_SIZE):
+    """텍스트 스트림 src 를 변환하여 dst 에 씀"""
+    for converted in convert_chunks(read_chunks(src, chunk_size)):
+        dst.write(converted)
+
+
+def iter_input_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', use_mmap=False):
+    """파일 하나를 텍스트 조각으로 읽음 ('-' 는 표준 입력)"""
+    if path == '-':
+        yield from read_chunks(sys.stdin, chunk_size)
+    elif use_mmap:
+        yield from read_mmap_chunks(path, chunk_size, encoding)
+    else:
+        # newline='' 로 열어 줄바꿈 문자를 그대로 유지
+        with open(path, encoding=encoding, newline='') as src:
+            yield from read_chunks(src, chunk_size)
+
+
+def convert_file(path, dst, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', use_mmap=False, workers=1,
+                 reverse=False, layout=DEFAULT_LAYOUT):
+    """
+    파일 하나를 변환하여 dst 에 씀 (workers 가 2 이상이면 공백 단위로 나눠 병렬 변환)
+    reverse 가 참이면 한글을 두벌식 키 입력으로 역변환합니다.
+    """
+    chunks = iter_input_chunks(path, chunk_size, encoding, use_mmap)
+    compiled = get_layout(layout)
+    if workers > 1:
+        if reverse:
+            converted = iter_convert_parallel(chunks, workers, hangeul_to_eng, None)
+        else:
+            converted = iter_convert_parallel(chunks, workers, compiled.convert, compiled.compose_into)
+    elif reverse:
+        converted = reverse_chunks(chunks)
+    else:
+        converted = convert_chunks(chunks, compiled.compose_into)
+    for piece in converted:
+        dst.write(piece)
+
+
+def build_parser():
+    """명령줄 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        description="영문 키보드로 잘못 입력된 텍스트 파일을 한글로 변환합니다.")
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help="입력 파일 (생략하거나 '-' 이면 표준 입력)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="출력 파일 (기본값: 표준 출력)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="한 번에 읽을 크기 (기본값: %(default)s)")
+    parser.add_argument('--encoding', default='utf-8',
+                        help="입출력 인코딩 (기본값: %(default)s)")
+    parser.add_argument('--mmap', action='store_true',
+                        help="로컬 입력 파일을 mmap 으로 읽음")
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help="병렬 변환에 쓸 프로세스 수 (기본값: 1, 공백 단위로 나눠 변환)")
+    parser.add_argument('-r', '--reverse', action='store_true',
+                        help="한글을 두벌식 키 입력으로 역변환")
+    parser.add_argument('--layout', default=DEFAULT_LAYOUT,
+                        help=f"입력 자판 (기본값: %(default)s, 내장: {', '.join(LAYOUTS)})")
+    parser.add_argument('--layout-file',
+                        help="사용자 정의 자판 JSON 파일 (등록 후 --layout 을 생략하면 이 자판 사용)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.chunk_size <= 0:
+        raise SystemExit("--chunk-size 는 양수여야 합니다.")
+    layout = args.layout
+    try:
+        if args.layout_file:
+            name = load_layout_file(args.layout_file)
+            if layout == DEFAULT_LAYOUT:
+                layout = name
+        get_layout(layout)
+    except (OSError, KeyError, ValueError) as error:
+        raise SystemExit(f"자판을 불러올 수 없습니다: {error.args[0] if error.args else error}")
+    if args.reverse and layout != DEFAULT_LAYOUT:
+        raise SystemExit("--reverse 는 두벌식 자판만 지원합니다.")
+
+    # 출력 파일을 열면 내용이 지워지므로, 입력 파일을 모두 열어 본 뒤에 엶
+    for path in args.inputs:
+        if path != '-':
+            try:
+                with open(path, 'rb'):
+                    pass
+            except OSError as error:
+                raise SystemExit(f"입력 파일을 열 수 없습니다: {path} ({error.strerror or error})")
+
+    if args.output == '-':
+        dst = sys.stdout
+    else:
+        try:
+            dst = open(args.output, 'w', encoding=args.encoding, newline='')
+        except OSError as error:
+            raise SystemExit(f"출력 파일을 열 수 없습니다: {args.output} ({error.strerror or error})")
+    try:
+        for path in args.inputs:
+            convert_file(path, dst, args.chunk_size, args.encoding, args.mmap, args.workers,
+                         args.reverse, layout)
+    except OSError as error:
+        raise SystemExit(f"변환 중 입출력 오류: {error}")
+    finally:
+        if dst is not sys.stdout:
+            dst.close()
+        else:
+            dst.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# --- 영타 자동 완성 제안 ---
+# 검색창 등에서 한글을 영문 자판 상태로 입력하고 있을 때, 지금까지 친 키로 시작하는 한국어 단어를
+# 빈도순으로 제안합니다 (dkssu → 안녕하세요, 안녕히).
+#
+# 어휘의 단어마다 두벌식 키 입력(hangeul_to_eng)을 미리 계산해 키 입력 순으로 정렬해 둡니다.
+# 정렬된 목록에서는 키 입력 트라이의 각 노드(같은 접두사)가 연속된 구간이므로, 노드는 이진 탐색 두 번으로 찾습니다.
+# 단어가 많이 딸린 노드(구간이 HEAVY_NODE 개를 넘을 수 있는 노드)만 상위 top_k 개를 미리 계산해 두고,
+# 나머지 노드는 구간(최대 2 * HEAVY_NODE 개)을 직접 훑어 고릅니다.
+# 키 입력과 단어는 각각 하나의 문자열로 이어 붙이고 시작 위치를 array('I') 로 두므로
+# 단어 수십만 개도 단어당 수십 바이트 정도만 씁니다.
+#
+# 어휘 파일은 한 줄에 단어 하나, 빈도는 공백/탭 뒤에 선택 (빈도가 같거나 없으면 파일에서 먼저 나온 단어가 앞).
+#
+# 사용 예:
+#   python hangeul_suggest.py words.txt dkssu rkawk
+import argparse
+import heapq
+import sys
+import time
+from array import array
+
+from hangeul_core import ENG_TO_JAMO, TYPED_KEY_TO_JAMO, eng_to_hangeul, hangeul_to_eng
+
+TOP_K = 10
+DEFAULT_SUGGESTIONS = 5
+HEAVY_NODE = 128
+
+# Shift 자모가 없는 대문자(Caps Lock, 문장 첫 글자 등) → 소문자 키 (fold_shift_keys 와 같은 규칙, Q/W/E/R/T/O/P 는 그대로)
+_FOLD_CAPITALS = {ord(key): key.lower() for key in TYPED_KEY_TO_JAMO if key not in ENG_TO_JAMO}
+
+# 어휘 파일이 없을 때 쓰는 기본 단어 (대략 자주 쓰는 순)
+BUILTIN_WORDS = (
+    "안녕하세요 감사합니다 네 아니요 사랑해요 괜찮아요 죄송합니다 안녕히 가세요 고맙습니다 "
+    "오늘 내일 어제 지금 여기 거기 우리 저는 제가 그리고 그래서 하지만 정말 너무 아주 "
+    "한국 한국어 한글 서울 부산 대한민국 사람 친구 가족 학교 학생 선생님 회사 회의 일정 "
+    "검색 주문 배송 조회 확인 취소 변경 결제 가입 로그인 로그아웃 비밀번호 아이디 문의 "
+    "날씨 시간 점심 저녁 아침 커피 물 밥 김치 라면 치킨 맥주 "
+    "동해물과 백두산이 마르고 닳도록 하느님이 보우하사 우리나라 만세 무궁화 삼천리 화려 강산 "
+    "반갑습니다 수고하셨습니다 알겠습니다 부탁드립니다 축하해요 보고 싶어요 생일 새해 복 "
+)
+
+
+class KeystrokeTrie:
+    """
+    두벌식 키 입력 접두사로 단어를 찾는 자동 완성 색인
+    words 는 단어 또는 (단어, 빈도) 의 반복이며, 빈도가 같으면 먼저 나온 단어가 앞입니다.
+    """
+
+    def __init__(self, words, top_k=TOP_K):
+        self.top_k = top_k
+        entries = {}   # 단어 → (빈도, 처음 나온 순서, 키 입력)
+        for order, entry in enumerate(words):
+            word, freq = (entry, 0) if isinstance(entry, str) else entry
+            if word in entries:
+                if freq > entries[word][0]:
+                    entries[word] = (freq, entries[word][1], entries[word][2])
+                continue
+            keys = hangeul_to_eng(word)
+            if keys != word and keys.isascii():   # 한글이 없거나 두벌식으로 칠 수 없는 글자가 섞인 단어는 제외
+                entries[word] = (freq, order, keys)
+
+        ranked = sorted(entries, key=lambda word: (-entries[word][0], entries[word][1]))
+        by_keys = sorted(range(len(ranked)), key=lambda rank: entries[ranked[rank]][2])
+        keys = [entries[ranked[rank]][2] for rank in by_keys]
+
+        self._keys = ''.join(keys)
+        self._key_starts = _starts(keys)
+        words = [ranked[rank] for rank in by_keys]
+        self._words = ''.join(words)
+        self._word_starts = _starts(words)
+        self._ranks = array('I', by_keys)            # 키 입력 순서 위치 → 빈도 순위
+        self._by_rank = array('I', [0]) * len(by_keys)   # 빈도 순위 → 키 입력 순서 위치
+        for position, rank in enumerate(by_keys):
+            self._by_rank[rank] = position
+
+        # 단어가 HEAVY_NODE 개 넘게 딸린 노드는 모두 어떤 i 와 i + HEAVY_NODE 의 공통 접두사이므로
+        # 그 간격으로 공통 접두사만 살펴 상위 top_k 를 미리 계산 (그보다 작은 노드는 검색 때 직접 훑음)
+        self._top = {}
+        for i in range(0, len(keys) - HEAVY_NODE, HEAVY_NODE):
+            first, last = keys[i], keys[i + HEAVY_NODE]
+            common = 0
+            while common < min(len(first), len(last)) and first[common] == last[common]:
+                common += 1
+            for length in range(common + 1):
+                prefix = first[:length]
+                if prefix not in self._top:
+                    lo, hi = self._range(prefix)
+                    self._top[prefix] = array('I', heapq.nsmallest(top_k, self._ranks[lo:hi]))
+
+    def __len__(self):
+        return len(self._ranks)
+
+    def _word(self, position):
+        return self._words[self._word_starts[position]:self._word_starts[position + 1]]
+
+    def _bisect(self, prefix, upper):
+        """키 입력이 prefix 보다 크거나 같은(upper 면 prefix 로 시작하는 것보다 뒤인) 첫 위치"""
+        keys, starts = self._keys, self._key_starts
+        size = len(prefix)
+        lo, hi = 0, len(self._ranks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = starts[mid]
+            head = keys[start:min(start + size, starts[mid + 1])]
+            if head < prefix or (upper and head == prefix):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _range(self, prefix):
+        """prefix 로 시작하는 키 입력의 구간 [lo, hi) — 트라이에서 prefix 노드 아래의 단어들"""
+        return self._bisect(prefix, False), self._bisect(prefix, True)
+
+    def suggest(self, prefix, k=DEFAULT_SUGGESTIONS):
+        """
+        키 입력이 prefix 로 시작하는 단어를 빈도순으로 최대 k 개 (top_k 보다 많이는 주지 않음)
+        조합기와 같이 Shift 자모가 없는 대문자는 소문자 키로 봅니다 (Dkssu → 안녕하세요).
+        """
+        prefix = prefix.translate(_FOLD_CAPITALS)
+        k = min(k, self.top_k)
+        ranks = self._top.get(prefix)
+        if ranks is None:
+            lo, hi = self._range(prefix)
+            ranks = heapq.nsmallest(k, self._ranks[lo:hi])
+        by_rank = self._by_rank
+        return [self._word(by_rank[rank]) for rank in ranks[:k]]
+
+
+def _starts(strings):
+    """이어 붙인 문자열에서 각 문자열의 시작 위치 (마지막에 전체 길이)"""
+    starts = array('I', [0])
+    total = 0
+    for string in strings:
+        total += len(string)
+        starts.append(total)
+    return starts
+
+
+def _read_vocabulary(src, name):
+    for line_no, line in enumerate(src, 1):
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) == 1:
+            yield fields[0], 0
+            continue
+        try:
+            yield fields[0], int(fields[1])
+        except ValueError:
+            raise ValueError(f"{name}:{line_no}: 빈도는 정수여야 합니다: {fields[1]!r}") from None
+
+
+def load_vocabulary(path, encoding='utf-8', top_k=TOP_K):
+    """어휘 파일(한 줄에 '단어' 또는 '단어 빈도')을 읽어 KeystrokeTrie 를 만듦"""
+    with open(path, encoding=encoding) as src:
+        return KeystrokeTrie(_read_vocabulary(src, path), top_k)
+
+
+def builtin_vocabulary(top_k=TOP_K):
+    """기본 단어 목록으로 만든 KeystrokeTrie"""
+    return KeystrokeTrie(BUILTIN_WORDS.split(), top_k)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="영문 자판 키 입력 접두사로 한국어 단어를 제안합니다.")
+    parser.add_argument('vocabulary', help="어휘 파일 (한 줄에 '단어' 또는 '단어 빈도', '-' 는 기본 단어 목록)")
+    parser.add_argument('prefixes', nargs='+', help="키 입력 접두사 (예: dkssu)")
+    parser.add_argument('-k', type=int, default=DEFAULT_SUGGESTIONS, help="접두사마다 보여줄 단어 수")
+    parser.add_argument('--encoding', default='utf-8', help="어휘 파일 인코딩 (기본값: %(default)s)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        trie = builtin_vocabulary() if args.vocabulary == '-' else load_vocabulary(args.vocabulary, args.encoding)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    print(f"# {len(trie):,} words loaded in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    for prefix in args.prefixes:
+        start = time.perf_counter()
+        words = trie.suggest(prefix, args.k)
+        elapsed = (time.perf_counter() - start) * 1_000_000
+        print(f"{prefix} ({eng_to_hangeul(prefix)}): {', '.join(words) or '-'} ({elapsed:.1f}µs)")
+
+
+if __name__ == "__main__":
+    main()
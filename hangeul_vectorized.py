@@ -0,0 +1,146 @@
+# --- NumPy 벡터화 일괄 변환 (선택 사항) ---
+# 두벌식 조합은 각 키의 바로 앞뒤 몇 글자만 보면 글자 경계가 정해집니다.
+#   - 자음 바로 뒤에 모음이 오면 그 자음은 항상 새 글자의 초성
+#   - 모음 뒤의 모음은 복합 모음(ㅗ+ㅏ 등)이 되면 앞 모음에 합쳐짐
+#   - 초성이 있는 글자의 모음 뒤 자음은 종성, 그 뒤 자음은 복합 종성이 될 수 있음
+#   - 나머지 자음/모음은 단독 자모
+# 이 규칙을 배열 연산으로 계산한 뒤 모든 코드포인트를 한 번에 만들어 문자열로 되돌립니다.
+# NumPy 가 없으면 eng_to_hangeul 로 변환합니다. 결과는 두 경로가 항상 같습니다.
+#
+# 배열은 문자당 수십 바이트를 쓰므로 입력을 약 block_size 문자 블록으로 나눠 처리합니다. 블록은 공백 뒤나
+# 모음 앞 자음(항상 새 글자의 초성) 앞에서만 자르므로 조합 결과가 달라지지 않습니다.
+import re
+
+from hangeul_core import (
+    CHOSUNG_LIST, JUNGSUNG_LIST, HANGEUL_BASE, DOUBLE_VOWELS, DOUBLE_CONSONANTS,
+    KEY_TABLE, CHO_TO_JONG, JUNG_COMBINE, JONG_COMBINE, eng_to_hangeul,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없이도 동작 (스칼라 엔진 사용)
+    np = None
+
+HAS_NUMPY = np is not None
+
+DEFAULT_BLOCK_SIZE = 1 << 20  # 한 번에 배열로 처리할 문자 수
+
+# 블록을 잘라도 되는 자리: 공백 바로 뒤, 또는 모음 키가 뒤따르는 자음 키 바로 앞
+_SAFE_CUT = re.compile(r'(?<=\s)|(?=[{}][{}])'.format(
+    ''.join(re.escape(key) for key, (_, jung) in sorted(KEY_TABLE.items()) if jung == -1),
+    ''.join(re.escape(key) for key, (_, jung) in sorted(KEY_TABLE.items()) if jung != -1)))
+
+# 복합 모음/종성이 다시 다른 자모와 합쳐지지 않아야(ㅗ+ㅏ+ㅣ 같은 연쇄가 없어야) 국소 규칙이 정확합니다.
+_LOCAL_RULES_EXACT = (
+    not {pair[0] for pair in DOUBLE_VOWELS} & {pair[1] for pair in DOUBLE_VOWELS}
+    and not set(DOUBLE_CONSONANTS.values()) & {pair[0] for pair in DOUBLE_CONSONANTS}
+)
+
+if HAS_NUMPY:
+    _N_CHO = len(CHOSUNG_LIST)
+    _N_JUNG = len(JUNGSUNG_LIST)
+
+    # ASCII 코드포인트 → 초성/중성 인덱스 (-1 은 해당 없음)
+    _KEY_CHO = np.full(128, -1, dtype=np.int32)
+    _KEY_JUNG = np.full(128, -1, dtype=np.int32)
+    for _key, (_cho, _jung) in KEY_TABLE.items():
+        if ord(_key) < 128:
+            _KEY_CHO[ord(_key)] = _cho
+            _KEY_JUNG[ord(_key)] = _jung
+    del _key, _cho, _jung
+
+    _CHO_TO_JONG = np.array(CHO_TO_JONG, dtype=np.int32)
+    _JUNG_COMBINE = np.array(JUNG_COMBINE, dtype=np.int32)
+    _JONG_COMBINE = np.array(JONG_COMBINE, dtype=np.int32)
+    # 단독 자모 출력용 호환 자모 코드포인트
+    _CHO_CODEPOINT = np.array([ord(jamo) for jamo in CHOSUNG_LIST], dtype=np.uint32)
+    _JUNG_CODEPOINT = np.array([ord(jamo) for jamo in JUNGSUNG_LIST], dtype=np.uint32)
+
+
+def _shift(values, offset, fill):
+    """values 를 offset 만큼 민 배열 (양수면 다음 원소, 음수면 이전 원소를 가져오고 빈 자리는 fill)"""
+    out = np.full_like(values, fill)
+    if offset > 0:
+        out[:-offset] = values[offset:]
+    else:
+        out[-offset:] = values[:offset]
+    return out
+
+
+def _convert_block(keys):
+    """키 문자열 하나를 배열 연산으로 조합"""
+    codepoints = np.frombuffer(keys.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    ascii_index = np.where(codepoints < 128, codepoints, 0)
+    cho = np.where(codepoints < 128, _KEY_CHO[ascii_index], -1)
+    jung = np.where(codepoints < 128, _KEY_JUNG[ascii_index], -1)
+    is_cons = cho >= 0
+    is_vowel = jung >= 0
+    is_other = ~(is_cons | is_vowel)
+
+    # 1. 모음: 앞 모음과 복합 모음이 되는 자리(merged)와 새 글자의 중성 자리(nucleus)
+    prev_jung = _shift(jung, -1, -1)
+    combined_jung = np.where(
+        is_vowel & (prev_jung >= 0),
+        _JUNG_COMBINE[np.maximum(prev_jung, 0) * _N_JUNG + np.maximum(jung, 0)],
+        -1)
+    merged = combined_jung >= 0
+    nucleus = is_vowel & ~merged
+
+    # 2. 자음: 모음 바로 앞이면 초성, 초성 있는 글자의 모음 뒤면 종성, 그 뒤 복합 종성
+    initial = is_cons & _shift(is_vowel, 1, False)
+    has_cho = nucleus & _shift(initial, -1, False)
+    # 모음 자리마다 그 글자에 초성이 있는지 (복합 모음 자리는 앞 중성 자리를 따름)
+    vowel_has_cho = has_cho | (merged & _shift(has_cho, -1, False))
+    single_jong = np.where(is_cons, _CHO_TO_JONG[np.maximum(cho, 0)], 0)
+    jong1 = is_cons & ~initial & _shift(vowel_has_cho, -1, False) & (single_jong > 0)
+    prev_single_jong = _shift(single_jong, -1, 0)
+    double_jong = np.where(
+        is_cons & _shift(jong1, -1, False),
+        _JONG_COMBINE[prev_single_jong * _N_CHO + np.maximum(cho, 0)],
+        0)
+    jong2 = ~initial & (double_jong > 0)
+    lone_cons = is_cons & ~initial & ~jong1 & ~jong2
+
+    # 3. 중성 자리 기준으로 최종 중성/종성 값 모으기
+    next_merged = _shift(merged, 1, False)
+    final_jung = np.where(next_merged, _shift(combined_jung, 1, -1), jung)
+    # 각 자리 바로 뒤에 붙는 종성 (복합 종성이 있으면 그 값)
+    jong_after = np.where(_shift(jong2, 2, False), _shift(double_jong, 2, 0),
+                          np.where(_shift(jong1, 1, False), _shift(single_jong, 1, 0), 0))
+    final_jong = np.where(next_merged, _shift(jong_after, 1, 0), jong_after)
+
+    # 4. 출력 코드포인트: 초성 자리에 완성형 글자, 그 외 단독 자모/기타 문자
+    syllable = (HANGEUL_BASE + _shift(np.maximum(cho, 0), -1, 0) * 588
+                + np.maximum(final_jung, 0) * 28 + final_jong)
+    out = np.where(is_other, codepoints, 0).astype(np.uint32)
+    out = np.where(initial, _shift(syllable, 1, 0), out)
+    lone_vowel = nucleus & ~has_cho
+    out = np.where(lone_vowel, _JUNG_CODEPOINT[np.maximum(final_jung, 0)], out)
+    out = np.where(lone_cons, _CHO_CODEPOINT[np.maximum(cho, 0)], out)
+
+    head = is_other | initial | lone_vowel | lone_cons
+    return out[head].astype(np.uint32).tobytes().decode('utf-32-le', 'surrogatepass')
+
+
+def _blocks(text, block_size):
+    """
+    text 를 조합 결과가 달라지지 않는 자리에서 약 block_size 문자씩 나눠 (블록, 배열로 처리할지) 를 내보냄
+    2 * block_size 안에 자를 자리가 없는 부분(자음만 길게 이어지는 등)은 스칼라 엔진으로 넘깁니다.
+    """
+    start = 0
+    length = len(text)
+    while length - start > block_size:
+        match = _SAFE_CUT.search(text, start + block_size)
+        cut = match.start() if match else length
+        yield text[start:cut], cut - start <= 2 * block_size
+        start = cut
+    if start < length:
+        yield text[start:], True
+
+
+def eng_to_hangeul_vectorized(text, block_size=DEFAULT_BLOCK_SIZE):
+    """eng_to_hangeul 과 같은 결과를 NumPy 배열 연산으로 계산 (NumPy 가 없으면 스칼라 엔진 사용)"""
+    if not HAS_NUMPY or not _LOCAL_RULES_EXACT:
+        return eng_to_hangeul(text)
+    return "".join(_convert_block(block) if vectorized else eng_to_hangeul(block)
+                   for block, vectorized in _blocks(text, block_size))
@@ -0,0 +1,43 @@
+# 키 입력 단위 변환기(hangeul_ime) 테스트
+import random
+
+from hangeul_core import eng_to_hangeul
+from hangeul_ime import HangeulIME
+
+
+def type_keys(ime, keys):
+    return ''.join(ime.feed(key) for key in keys)
+
+
+def test_backspace_splits_double_vowel():
+    ime = HangeulIME()
+    type_keys(ime, 'rhk')
+    assert ime.composing == '과'
+    assert ime.backspace()
+    assert ime.composing == '고'
+
+
+def test_backspace_splits_double_jong():
+    ime = HangeulIME()
+    type_keys(ime, 'ekfr')
+    assert ime.composing == '닭'
+    assert ime.backspace()
+    assert ime.composing == '달'
+
+
+def test_backspace_on_empty_composer():
+    ime = HangeulIME()
+    assert ime.backspace() is False
+    type_keys(ime, 'r')
+    assert ime.backspace()
+    assert ime.composing == ''
+    assert ime.backspace() is False
+
+
+def test_feed_and_flush_match_eng_to_hangeul():
+    rng = random.Random(0)
+    keys = 'rRsefFaqQtTdwWczxvgkoiOjpuPhynbml .1'
+    for _ in range(2000):
+        text = ''.join(rng.choice(keys) for _ in range(rng.randint(0, 20)))
+        ime = HangeulIME()
+        assert type_keys(ime, text) + ime.flush() == eng_to_hangeul(text), text
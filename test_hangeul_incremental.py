@@ -0,0 +1,49 @@
+# 편집 인식 증분 변환기(hangeul_incremental) 테스트
+import random
+import re
+
+from hangeul_core import eng_to_hangeul
+from hangeul_incremental import IncrementalConverter
+
+KEYS = 'rRseEfaqQtTdwWczxvgkoiOjpuPhynbml'
+BLOCK_SIZE = 16
+
+
+def random_text(rng, length):
+    return ''.join(rng.choice(KEYS) if rng.random() < 0.8 else rng.choice(' \n.') for _ in range(length))
+
+
+def longest_word(text):
+    return max(map(len, re.split(r'\s', text)), default=0)
+
+
+def test_random_edits_match_full_conversion():
+    rng = random.Random(0)
+    converter = IncrementalConverter(block_size=BLOCK_SIZE)
+    text = random_text(rng, 400)
+    assert converter.update(text) == eng_to_hangeul(text)
+
+    for _ in range(2000):
+        start = rng.randrange(len(text) + 1)
+        end = min(len(text), start + rng.randint(0, 5))
+        inserted = random_text(rng, rng.randint(0, 5))
+        kind = rng.choice(('insert', 'delete', 'replace'))
+        if kind == 'insert':
+            end = start
+        elif kind == 'delete':
+            inserted = ''
+        old = text
+        text = text[:start] + inserted + text[end:]
+
+        assert converter.update(text) == eng_to_hangeul(text)
+        # 작은 편집은 문서 길이와 상관없이 그 주변 블록 몇 개만 다시 변환
+        block = BLOCK_SIZE + max(longest_word(old), longest_word(text))
+        assert converter.last_reconverted <= 3 * block + len(inserted)
+
+
+def test_unchanged_text_is_not_reconverted():
+    converter = IncrementalConverter(block_size=BLOCK_SIZE)
+    text = 'dkssudgktpdy rkatkgkqslek ' * 20
+    converter.update(text)
+    assert converter.update(text) == eng_to_hangeul(text)
+    assert converter.last_reconverted == 0
@@ -0,0 +1,24 @@
+# 자동 완성(hangeul_suggest) 테스트
+from hangeul_suggest import KeystrokeTrie, builtin_vocabulary
+
+
+def test_suggest_by_keystroke_prefix():
+    trie = builtin_vocabulary()
+    assert trie.suggest('dkssu') == ['안녕하세요', '안녕히']
+
+
+def test_capitals_fold_like_the_composer():
+    trie = builtin_vocabulary()
+    assert trie.suggest('Dkssu') == trie.suggest('dkssu')
+    assert trie.suggest('DKSSU') == trie.suggest('dkssu')
+
+
+def test_shift_keys_stay_distinct():
+    trie = KeystrokeTrie([('빵', 1), ('방', 2)])
+    assert trie.suggest('Qk') == ['빵']
+    assert trie.suggest('qk') == ['방']
+
+
+def test_frequency_order():
+    trie = KeystrokeTrie([('가방', 1), ('가을', 5), ('가게', 3)])
+    assert trie.suggest('rk') == ['가을', '가게', '가방']